@@ -12,10 +12,15 @@ Every tool call is intercepted and validated by BasalGuardCore.
 No API keys are hardcoded in this script.
 """
 
+import asyncio
 import json
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 # ── Ensure PYTHONPATH ────────────────────────────────────────────────
 _ROOT = Path(__file__).resolve().parent
@@ -26,19 +31,18 @@ for _p in (
     if str(_p) not in sys.path:
         sys.path.insert(0, str(_p))
 
-try:
-    from openai import OpenAI, APIError
-except ImportError:
-    print("❌ Erro: Biblioteca 'openai' não instalada.")
-    print("Instale com: pip install openai")
-    sys.exit(1)
-
-
 # Imports do BasalGuard (TaipanStack)
 from basalguard.core.agent_firewall import BasalGuardCore
 from basalguard.llm_interface.executor import ToolExecutor
 from basalguard.llm_interface.tool_schemas import BASALGUARD_TOOLS
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Cores para o terminal
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -56,6 +60,169 @@ def _get_input(prompt: str, default: str | None = None, is_secret: bool = False)
     return value if value else (default or "")
 
 
+def _truncate(s: str, n: int = 200) -> str:
+    """Shorten *s* to *n* characters for display."""
+    return s[:n] + "..." if len(s) > n else s
+
+
+# Pool compartilhado entre turnos para executar as tool calls.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="basalguard-tool")
+# Tools sem efeitos colaterais: podem rodar em paralelo sem mudar o resultado.
+_READ_ONLY_TOOLS = frozenset(
+    {"read_file", "read_file_paged", "search_in_file", "web_request"}
+)
+
+# Janela de histórico enviada a cada chamada (além do system prompt fixo).
+_HISTORY_LEN = 32
+
+
+def _window(system_msg: dict[str, Any], history: deque[Any]) -> list[Any]:
+    """Build the request messages: pinned system prompt + rolling history.
+
+    Tool results whose assistant ``tool_calls`` message was evicted from
+    the window are dropped, since the API rejects unpaired tool messages.
+    """
+    start = 0
+    while (
+        start < len(history)
+        and isinstance(history[start], dict)
+        and history[start].get("role") == "tool"
+    ):
+        start += 1
+    return [system_msg, *islice(history, start, None)]
+
+
+def _push_pair(history: deque[Any], msg: Any, tool_msgs: list[dict[str, Any]]) -> None:
+    """Append an assistant tool-call message together with its tool results."""
+    history.append(msg)
+    history.extend(tool_msgs)
+
+
+def _run_tool(executor: ToolExecutor, tool_name: str, raw_args: str) -> str:
+    """Parse the LLM's arguments and run one tool call through BasalGuard."""
+    return executor.execute_tool_call(tool_name, _loads(raw_args))
+
+
+async def _run_tools(executor: ToolExecutor, tool_calls: list[Any]) -> list[Any]:
+    """Run a turn's tool calls on the shared pool, results in call order.
+
+    Read-only calls are independent and run concurrently; as soon as one
+    call writes or runs a command, the turn runs sequentially so the
+    effects happen in the order the LLM asked for them.  Exceptions are
+    returned in place of the result.
+    """
+    loop = asyncio.get_running_loop()
+    jobs = [
+        (_run_tool, executor, tc.function.name, tc.function.arguments)
+        for tc in tool_calls
+    ]
+    if all(tc.function.name in _READ_ONLY_TOOLS for tc in tool_calls):
+        return await asyncio.gather(
+            *(loop.run_in_executor(_TOOL_POOL, *job) for job in jobs),
+            return_exceptions=True,
+        )
+    outcomes: list[Any] = []
+    for job in jobs:
+        try:
+            outcomes.append(await loop.run_in_executor(_TOOL_POOL, *job))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+async def _turn(
+    client: Any,
+    model_name: str,
+    executor: ToolExecutor,
+    system_msg: dict[str, Any],
+    history: deque[Any],
+) -> str | None:
+    """Run one user turn: LLM decision, tool calls via BasalGuard, answer.
+
+    ``history`` must already end with the user message; every message
+    produced during the turn is appended to it.
+    """
+    response = await client.chat.completions.create(
+        model=model_name,
+        messages=_window(system_msg, history),
+        tools=BASALGUARD_TOOLS,
+        tool_choice="auto",
+        temperature=0.1,
+    )
+
+    msg = response.choices[0].message
+
+    # Resposta direta sem tools
+    if not msg.tool_calls:
+        history.append({"role": "assistant", "content": msg.content})
+        return msg.content
+
+    # Se a IA decidiu usar ferramentas
+    tool_calls = msg.tool_calls
+    for tool_call in tool_calls:
+        print(f"{YELLOW}🤖 IA solicitou: {tool_call.function.name}{RESET}")
+
+    # EXECUÇÃO SEGURA 🛡️ (no pool compartilhado, na ordem das chamadas)
+    outcomes = await _run_tools(executor, tool_calls)
+
+    tool_msgs = []
+    for tool_call, outcome in zip(tool_calls, outcomes):
+        if isinstance(outcome, Exception):
+            result = f"Erro na execução da tool: {str(outcome)}"
+            print(f"{RED}❌ Erro interno: {result}{RESET}")
+        else:
+            result = outcome
+            # Verifica se foi bloqueado (campo status, não busca textual)
+            if _loads(result).get("status") == "blocked":
+                print(f"{RED}🛡️  BASALGUARD BLOQUEOU: {result}{RESET}")
+            else:
+                print(f"{GREEN}✅ BasalGuard permitiu: {_truncate(result)}{RESET}")
+
+        tool_msgs.append(
+            {
+                "tool_call_id": tool_call.id,
+                "role": "tool",
+                "name": tool_call.function.name,
+                "content": result,
+            }
+        )
+
+    # Intenção da IA e resultados entram juntos no histórico
+    _push_pair(history, msg, tool_msgs)
+
+    # Segunda chamada: IA processa o resultado e responde ao usuário
+    final_response = await client.chat.completions.create(
+        model=model_name, messages=_window(system_msg, history)
+    )
+    final_answer = final_response.choices[0].message.content
+    history.append({"role": "assistant", "content": final_answer})
+    return final_answer
+
+
+async def run_batch(
+    client: Any,
+    model_name: str,
+    executor: ToolExecutor,
+    system_prompt: str,
+    prompts: list[str],
+) -> list[str | None | BaseException]:
+    """Answer independent prompts concurrently (evaluation mode).
+
+    Each prompt gets its own conversation; all turns share the client's
+    connection pool, so N prompts cost roughly one turn of wall time
+    instead of N.  Failures are returned in place of the answer.
+    """
+    system_msg = {"role": "system", "content": system_prompt}
+    histories = [
+        deque([{"role": "user", "content": prompt}], maxlen=_HISTORY_LEN)
+        for prompt in prompts
+    ]
+    return await asyncio.gather(
+        *(_turn(client, model_name, executor, system_msg, h) for h in histories),
+        return_exceptions=True,
+    )
+
+
 def main():
     print(
         f"{BLUE}╔══════════════════════════════════════════════════════════════╗{RESET}"
@@ -92,30 +259,47 @@ def main():
     default_model = os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo")
     model_name = _get_input("Nome do Modelo", default_model)
 
-    # 2. Inicialização do Cliente
+    # Import tardio: o grafo de módulos do SDK só é carregado quando
+    # realmente vamos falar com a API.
     try:
-        print(f"\n{DIM}Conectando a {base_url}...{RESET}", end=" ")
-        client = OpenAI(base_url=base_url, api_key=api_key)
-        # Teste rápido (listar modelos nem sempre funciona em todos proxies, mas é um bom teste)
-        # Para ser mais genérico, tentamos listar, se falhar, avisamos mas prosseguimos.
+        from openai import AsyncOpenAI
+    except ImportError:
+        print("❌ Erro: Biblioteca 'openai' não instalada.")
+        print("Instale com: pip install openai")
+        sys.exit(1)
+
+    # Um único event loop para toda a sessão: o pool de conexões do
+    # cliente assíncrono é reaproveitado entre os turnos.
+    with asyncio.Runner() as runner:
+        # 2. Inicialização do Cliente
         try:
-            client.models.list()
-            print(f"{GREEN}OK!{RESET}")
-        except Exception:
-            print(f"{YELLOW}Aviso (list models falhou, mas continuando...){RESET}")
-
-    except Exception as e:
-        print(f"\n{RED}❌ Falha crítica na inicialização do cliente: {e}{RESET}")
-        return
-
-    # 3. Inicialização do BasalGuard
-    workspace_path = _ROOT / "safe_workspace"
-    print(f"🛡️  Inicializando BasalGuard em: {workspace_path}")
-    core = BasalGuardCore(workspace_path)
-    executor = ToolExecutor(core)
-
-    # 4. System Prompt
-    system_prompt = """
+            client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+            # Teste de conexão opcional (BASALGUARD_PROBE=1 ou --probe): custa
+            # um round-trip HTTPS e listar modelos nem sempre funciona em
+            # todos os proxies. Se falhar, avisamos mas prosseguimos.
+            probe_env = os.environ.get("BASALGUARD_PROBE", "").strip().lower()
+            if probe_env in {"1", "true", "yes"} or "--probe" in sys.argv[1:]:
+                print(f"\n{DIM}Conectando a {base_url}...{RESET}", end=" ")
+                try:
+                    runner.run(client.models.list())
+                    print(f"{GREEN}OK!{RESET}")
+                except Exception:
+                    print(
+                        f"{YELLOW}Aviso (list models falhou, mas continuando...){RESET}"
+                    )
+
+        except Exception as e:
+            print(f"\n{RED}❌ Falha crítica na inicialização do cliente: {e}{RESET}")
+            return
+
+        # 3. Inicialização do BasalGuard
+        workspace_path = _ROOT / "safe_workspace"
+        print(f"🛡️  Inicializando BasalGuard em: {workspace_path}")
+        core = BasalGuardCore(workspace_path)
+        executor = ToolExecutor(core)
+
+        # 4. System Prompt
+        system_prompt = """
     Você é um Engenheiro DevOps Sênior operando dentro de um ambiente seguro chamado BasalGuard.
     
     REGRAS CRÍTICAS DE SEGURANÇA:
@@ -126,96 +310,55 @@ def main():
     5. Seja conciso e técnico.
     """
 
-    messages = [{"role": "system", "content": system_prompt}]
-
-    print(f"\n{YELLOW}💬 Digite 'sair' para encerrar.{RESET}\n")
-
-    # 5. Loop Interativo
-    while True:
-        try:
-            user_input = input(f"{BLUE}Você: {RESET}")
-            if user_input.lower() in ["sair", "exit", "quit"]:
-                print("👋 Encerrando.")
-                break
-
-            if not user_input.strip():
-                continue
-
-            messages.append({"role": "user", "content": user_input})
-
-            # Chamada à LLM
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                tools=BASALGUARD_TOOLS,
-                tool_choice="auto",
-                temperature=0.1,
+        # Modo avaliação: um prompt por linha, respondidos em paralelo.
+        batch_file = os.environ.get("BASALGUARD_BATCH_FILE")
+        if batch_file:
+            prompts = [
+                line.strip()
+                for line in Path(batch_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            answers = runner.run(
+                run_batch(client, model_name, executor, system_prompt, prompts)
             )
-
-            msg = response.choices[0].message
-
-            # Se a IA decidiu usar ferramentas
-            if msg.tool_calls:
-                messages.append(msg)  # Adiciona a intenção da IA ao histórico
-
-                for tool_call in msg.tool_calls:
-                    print(f"{YELLOW}🤖 IA solicitou: {tool_call.function.name}{RESET}")
-
-                    # Executa através do BasalGuard
-                    tool_name = tool_call.function.name
-                    raw_args = tool_call.function.arguments
-                    try:
-                        args = json.loads(raw_args)
-
-                        # EXECUÇÃO SEGURA 🛡️
-                        result = executor.execute_tool_call(tool_name, args)
-
-                        # Verifica se foi bloqueado
-                        if (
-                            "status" in result and '"blocked"' in result
-                        ):  # Simple string check for JSON
-                            print(f"{RED}🛡️  BASALGUARD BLOQUEOU: {result}{RESET}")
-                        else:
-                            # Truncate long output for display
-                            display_result = (
-                                result[:200] + "..." if len(result) > 200 else result
-                            )
-                            print(
-                                f"{GREEN}✅ BasalGuard permitiu: {display_result}{RESET}"
-                            )
-
-                    except Exception as e:
-                        result = f"Erro na execução da tool: {str(e)}"
-                        print(f"{RED}❌ Erro interno: {result}{RESET}")
-
-                    # Adiciona o resultado ao histórico
-                    messages.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "role": "tool",
-                            "name": tool_name,
-                            "content": result,
-                        }
-                    )
-
-                # Segunda chamada: IA processa o resultado e responde ao usuário
-                final_response = client.chat.completions.create(
-                    model=model_name, messages=messages
+            for prompt, answer in zip(prompts, answers):
+                print(f"\n{BLUE}Você:{RESET} {prompt}")
+                if isinstance(answer, BaseException):
+                    print(f"{RED}❌ Erro: {answer}{RESET}")
+                else:
+                    print(f"{BLUE}🤖 IA:{RESET} {answer}")
+            return
+
+        # System prompt fixo + janela deslizante com as últimas mensagens
+        system_msg = {"role": "system", "content": system_prompt}
+        history: deque[Any] = deque(maxlen=_HISTORY_LEN)
+
+        print(f"\n{YELLOW}💬 Digite 'sair' para encerrar.{RESET}\n")
+
+        # 5. Loop Interativo
+        while True:
+            try:
+                user_input = input(f"{BLUE}Você: {RESET}")
+                if user_input.lower() in ["sair", "exit", "quit"]:
+                    print("👋 Encerrando.")
+                    break
+
+                if not user_input.strip():
+                    continue
+
+                history.append({"role": "user", "content": user_input})
+
+                # Chamada à LLM (decisão, ferramentas e resposta final)
+                answer = runner.run(
+                    _turn(client, model_name, executor, system_msg, history)
                 )
-                final_answer = final_response.choices[0].message.content
-                print(f"\n{BLUE}🤖 IA:{RESET} {final_answer}\n")
-                messages.append({"role": "assistant", "content": final_answer})
+                print(f"\n{BLUE}🤖 IA:{RESET} {answer}\n")
 
-            else:
-                # Resposta direta sem tools
-                print(f"\n{BLUE}🤖 IA:{RESET} {msg.content}\n")
-                messages.append({"role": "assistant", "content": msg.content})
-
-        except KeyboardInterrupt:
-            print("\n👋 Interrompido pelo usuário.")
-            break
-        except Exception as e:
-            print(f"{RED}❌ Erro: {e}{RESET}")
+            except KeyboardInterrupt:
+                print("\n👋 Interrompido pelo usuário.")
+                break
+            except Exception as e:
+                print(f"{RED}❌ Erro: {e}{RESET}")
 
 
 if __name__ == "__main__":
@@ -20,8 +20,8 @@ Run::
 from __future__ import annotations
 
 import json
+import mmap
 import sys
-import textwrap
 from pathlib import Path
 from typing import Any
 
@@ -64,37 +64,130 @@ class _C:
                 setattr(cls, attr, "")
 
 
-if not sys.stdout.isatty():
+_COLOUR = sys.stdout.isatty()
+if not _COLOUR:
     _C.disable()
 
+# Bare module-level names: one global lookup per use instead of an attribute.
+RESET = _C.RESET
+BOLD = _C.BOLD
+DIM = _C.DIM
+RED = _C.RED
+GREEN = _C.GREEN
+YELLOW = _C.YELLOW
+MAGENTA = _C.MAGENTA
+CYAN = _C.CYAN
+WHITE = _C.WHITE
+BG_GRN = _C.BG_GRN
+
+# Constant decorations — built once, after the colour decision above.
+_RULE = f"  {'─' * 56}\n"
+_HEADERS = {
+    role: f"\n  {icon}{RESET}\n{_RULE}"
+    for role, icon in {
+        "system": f"{DIM}⚙️  SYSTEM",
+        "user": f"{CYAN}👤 USER",
+        "assistant": f"{MAGENTA}🤖 ASSISTANT",
+        "tool": f"{YELLOW}🛡️  TOOL RESULT",
+    }.items()
+}
+_TOOL_CALL_HEAD = (
+    f"\n  {MAGENTA}🤖 ASSISTANT → tool_call{RESET}\n"
+    f"{_RULE}"
+    f"  {BOLD}Function:{RESET} {YELLOW}"
+)
+_ARGUMENTS = f"{RESET}\n  {BOLD}Arguments:{RESET}\n"
+
+# Constant banner pre-encoded once; it bypasses the text layer entirely.
+_BANNER = f"""
+{BOLD}{CYAN}╔══════════════════════════════════════════════════════════════╗
+║        🤖  BasalGuard — Simple Agent Simulation  🛡️         ║
+║          Mock LLM + Real Firewall + Tool Executor            ║
+╚══════════════════════════════════════════════════════════════╝{RESET}
+
+""".encode()
+
+
+# ── JSON helpers (orjson when available) ────────────────────────────
+
+try:
+    import orjson
+
+    _loads = orjson.loads
 
-def _json(obj: Any) -> str:
-    return json.dumps(obj, indent=2, ensure_ascii=False)
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
 
+except ImportError:
+    _loads = json.loads
 
-def _print_msg(role: str, content: str, *, colour: str = "") -> None:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write(data: bytes) -> None:
+    """Write pre-encoded UTF-8 straight to stdout's binary buffer."""
+    out = sys.stdout
+    out.flush()  # keep ordering with anything written as text
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode())
+    else:
+        buffer.write(data)
+
+
+def _print_file_preview(path: Path) -> None:
+    """Print *path* dimmed and indented, streaming its lines through an mmap."""
+    head, tail = f"    {DIM}".encode(), f"{RESET}\n".encode()
+    buffer = getattr(sys.stdout, "buffer", None)
+    with open(path, "rb") as f:
+        try:
+            mm = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if buffer is not None
+                else None
+            )
+        except ValueError:  # zero-size files cannot be mapped
+            mm = None
+        if mm is None or buffer is None:
+            text = f.read().decode("utf-8")
+            sys.stdout.write(
+                "".join(f"    {DIM}{ln}{RESET}\n" for ln in text.split("\n"))
+            )
+            return
+        with mm:
+            sys.stdout.flush()  # keep ordering with anything written as text
+            for line in iter(mm.readline, b""):
+                buffer.write(head + line.rstrip(b"\n") + tail)
+            if mm[-1:] == b"\n":  # same trailing empty line as str.split
+                buffer.write(head + tail)
+
+
+def _dim_lines(text: str) -> str:
+    """Indent and dim every line of ``text`` (newline-terminated)."""
+    return "".join(f"    {DIM}{line}{RESET}\n" for line in text.split("\n"))
+
+
+def _colour_print_msg(role: str, content: str, *, colour: str = "") -> None:
     """Print a message in the agent conversation format."""
-    icons = {
-        "system": f"{_C.DIM}⚙️  SYSTEM",
-        "user": f"{_C.CYAN}👤 USER",
-        "assistant": f"{_C.MAGENTA}🤖 ASSISTANT",
-        "tool": f"{_C.YELLOW}🛡️  TOOL RESULT",
-    }
-    header = icons.get(role, role)
-    print(f"\n  {header}{_C.RESET}")
-    print(f"  {'─' * 56}")
-    for line in content.split("\n"):
-        print(f"  {colour}{line}{_C.RESET}")
+    header = _HEADERS.get(role) or f"\n  {role}{RESET}\n{_RULE}"
+    body = "".join(f"  {colour}{line}{RESET}\n" for line in content.split("\n"))
+    sys.stdout.write(header + body)
+
+
+def _plain_print_msg(role: str, content: str, *, colour: str = "") -> None:
+    """Colour-free :func:`_colour_print_msg` for piped output."""
+    header = _HEADERS.get(role) or f"\n  {role}\n{_RULE}"
+    sys.stdout.write(header + "  " + content.replace("\n", "\n  ") + "\n")
+
+
+# Specialise once for the colour decision instead of interpolating empty codes.
+_print_msg = _colour_print_msg if _COLOUR else _plain_print_msg
 
 
 def _print_tool_call(name: str, args: dict[str, Any]) -> None:
     """Print a tool call from the mock LLM."""
-    print(f"\n  {_C.MAGENTA}🤖 ASSISTANT → tool_call{_C.RESET}")
-    print(f"  {'─' * 56}")
-    print(f"  {_C.BOLD}Function:{_C.RESET} {_C.YELLOW}{name}{_C.RESET}")
-    print(f"  {_C.BOLD}Arguments:{_C.RESET}")
-    for line in _json(args).split("\n"):
-        print(f"    {_C.DIM}{line}{_C.RESET}")
+    sys.stdout.write(_TOOL_CALL_HEAD + name + _ARGUMENTS + _dim_lines(_dumps(args)))
 
 
 # ── Mock LLM ────────────────────────────────────────────────────────
@@ -110,18 +203,12 @@ class MockLLM:
     def __init__(self) -> None:
         self._step = 0
 
-    def get_response(self, messages: list[dict[str, Any]]) -> dict[str, Any]:
-        """Return the next scripted response.
-
-        Returns:
-            A dict mimicking the OpenAI ChatCompletion message format.
-
-        """
-        self._step += 1
-
-        # ── Turn 1: LLM decides to create main.py ───────────────────
-        if self._step == 1:
-            return {
+        # The script never changes, so every response (including the
+        # JSON-encoded arguments) is built once up front.  Steps are keyed
+        # by index; subclasses can swap ``_script`` / ``_final`` wholesale.
+        self._script: dict[int, dict[str, Any]] = {
+            # ── Turn 1: LLM decides to create main.py ───────────────
+            0: {
                 "role": "assistant",
                 "content": None,
                 "tool_calls": [
@@ -149,11 +236,9 @@ class MockLLM:
                         },
                     }
                 ],
-            }
-
-        # ── Turn 2: LLM reads back the file to confirm ──────────────
-        if self._step == 2:
-            return {
+            },
+            # ── Turn 2: LLM reads back the file to confirm ──────────
+            1: {
                 "role": "assistant",
                 "content": None,
                 "tool_calls": [
@@ -166,11 +251,9 @@ class MockLLM:
                         },
                     }
                 ],
-            }
-
-        # ── Turn 3: LLM runs the script ─────────────────────────────
-        if self._step == 3:
-            return {
+            },
+            # ── Turn 3: LLM runs the script ─────────────────────────
+            2: {
                 "role": "assistant",
                 "content": None,
                 "tool_calls": [
@@ -187,10 +270,10 @@ class MockLLM:
                         },
                     }
                 ],
-            }
-
-        # ── Turn 4: Final answer ────────────────────────────────────
-        return {
+            },
+        }
+        # ── Turn 4: Final answer (also returned for any later step) ─
+        self._final: dict[str, Any] = {
             "role": "assistant",
             "content": (
                 "✅ Pronto! Criei o arquivo `main.py` que imprime "
@@ -200,18 +283,24 @@ class MockLLM:
             "tool_calls": None,
         }
 
+    def get_response(self, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        """Return the next scripted response.
+
+        Returns:
+            A dict mimicking the OpenAI ChatCompletion message format.
+
+        """
+        resp = self._script.get(self._step, self._final)
+        self._step += 1
+        return resp
+
 
 # ── Agent Loop ───────────────────────────────────────────────────────
 
 
 def main() -> None:
     """Run the simulated agent loop."""
-    print(f"""
-{_C.BOLD}{_C.CYAN}╔══════════════════════════════════════════════════════════════╗
-║        🤖  BasalGuard — Simple Agent Simulation  🛡️         ║
-║          Mock LLM + Real Firewall + Tool Executor            ║
-╚══════════════════════════════════════════════════════════════╝{_C.RESET}
-""")
+    _write(_BANNER)
 
     # ── Setup ────────────────────────────────────────────────────────
     workspace = _ROOT / "agent_workspace"
@@ -219,11 +308,11 @@ def main() -> None:
     executor = ToolExecutor(firewall)
     llm = MockLLM()
 
-    print(f"  ⚙️  Workspace:  {_C.BOLD}{firewall.workspace_root}{_C.RESET}")
+    print(f"  ⚙️  Workspace:  {BOLD}{firewall.workspace_root}{RESET}")
     print(
-        f"  ⚙️  Tools:      {_C.DIM}{[t['function']['name'] for t in BASALGUARD_TOOLS]}{_C.RESET}"
+        f"  ⚙️  Tools:      {DIM}{[t['function']['name'] for t in BASALGUARD_TOOLS]}{RESET}"
     )
-    print(f"  ⚙️  Allowlist:  {_C.DIM}{sorted(firewall.command_allowlist)}{_C.RESET}")
+    print(f"  ⚙️  Allowlist:  {DIM}{sorted(firewall.command_allowlist)}{RESET}")
 
     # ── Conversation ────────────────────────────────────────────────
     system_prompt = (
@@ -249,7 +338,7 @@ def main() -> None:
         # If the LLM gave a final text answer, we're done.
         if not tool_calls:
             final_text = response.get("content", "")
-            _print_msg("assistant", final_text, colour=_C.GREEN)
+            _print_msg("assistant", final_text, colour=GREEN)
             messages.append(response)
             break
 
@@ -259,20 +348,20 @@ def main() -> None:
         for call in tool_calls:
             fn = call["function"]
             name = fn["name"]
-            args = json.loads(fn["arguments"])
+            args = _loads(fn["arguments"])
 
             _print_tool_call(name, args)
 
             # Execute through BasalGuard
             output = executor.execute_tool_call(name, args)
-            result_dict = json.loads(output)
+            result_dict = _loads(output)
 
             # Visual feedback
             status = result_dict.get("status", "unknown")
             if status == "success":
-                badge = f"{_C.BG_GRN}{_C.BOLD} ✅ PERMITIDO {_C.RESET}"
+                badge = f"{BG_GRN}{BOLD} ✅ PERMITIDO {RESET}"
             else:
-                badge = f"{_C.RED}{_C.BOLD} 🛡️  BLOQUEADO {_C.RESET}"
+                badge = f"{RED}{BOLD} 🛡️  BLOQUEADO {RESET}"
 
             print(f"\n  {badge}")
             # Show a concise view of the result
@@ -282,8 +371,7 @@ def main() -> None:
                 if len(content_preview) > 200:
                     content_preview = content_preview[:200] + "..."
                 display["content_preview"] = content_preview
-            for line in _json(display).split("\n"):
-                print(f"    {_C.DIM}{line}{_C.RESET}")
+            sys.stdout.write(_dim_lines(_dumps(display)))
 
             # Append tool result to conversation
             messages.append(
@@ -295,21 +383,25 @@ def main() -> None:
             )
 
     # ── Summary ──────────────────────────────────────────────────────
-    print(f"\n{_C.BOLD}{_C.WHITE}{'═' * 62}{_C.RESET}")
-    print(
-        f"  📊 {_C.BOLD}Conversação finalizada{_C.RESET} — "
-        f"{len(messages)} mensagens trocadas"
-    )
+    sep = f"{BOLD}{WHITE}{'═' * 62}{RESET}"
+    lines = [
+        f"\n{sep}",
+        f"  📊 {BOLD}Conversação finalizada{RESET} — "
+        f"{len(messages)} mensagens trocadas",
+    ]
 
     # Show the file was actually created
     created = workspace / "main.py"
     if created.exists():
-        print(f"\n  📁 Arquivo criado: {_C.GREEN}{created}{_C.RESET}")
-        print(f"  {_C.DIM}{'─' * 56}{_C.RESET}")
-        for line in created.read_text(encoding="utf-8").split("\n"):
-            print(f"    {_C.DIM}{line}{_C.RESET}")
-
-    print(f"{_C.BOLD}{_C.WHITE}{'═' * 62}{_C.RESET}\n")
+        lines.append(f"\n  📁 Arquivo criado: {GREEN}{created}{RESET}")
+        lines.append(f"  {DIM}{'─' * 56}{RESET}")
+        print("\n".join(lines))
+        _print_file_preview(created)
+    else:
+        print("\n".join(lines))
+
+    print(f"{sep}\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
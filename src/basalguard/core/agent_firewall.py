@@ -27,19 +27,24 @@ Typical usage::
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import codecs
+import contextlib
 import logging
+import os
+import stat
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 import httpx
 
 from basalguard.security.network import validate_url
 from basalguard.tools.advanced_file_ops import read_file_paged, search_in_file
-from taipanstack.security.guards import (
-    SecurityError,
-    guard_command_injection,
-    guard_path_traversal,
-)
+from taipanstack.security.guards import SecurityError, guard_path_traversal
 from taipanstack.security.sanitizers import sanitize_filename
 from taipanstack.security.validators import validate_project_name
 from taipanstack.utils.subprocess import SafeCommandResult, run_safe_command
@@ -71,12 +76,34 @@ DEFAULT_COMMAND_ALLOWLIST: frozenset[str] = frozenset(
 # Maximum file size for reads (1 MiB) — prevents DoS on huge files.
 _MAX_READ_SIZE_BYTES: int = 1_048_576
 
-# Maximum response body to keep in memory (100 KiB).
+# Chunk size for streaming reads (64 KiB).
+_READ_CHUNK_BYTES: int = 64 * 1024
+
+# Maximum response body to keep in memory (100 KiB, counted in bytes
+# as the body is streamed so larger responses are never buffered).
 _MAX_RESPONSE_BODY: int = 100 * 1024
 
 # HTTP request timeout in seconds.
 _HTTP_TIMEOUT_SECONDS: int = 10
 
+# Keep-alive pool shared by every web_request of a firewall instance.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30,
+)
+
+# Raw-fd file I/O flags: never leak descriptors into agent subprocesses,
+# never let Windows translate newlines, and never block opening a FIFO
+# for reading (it is rejected by the fstat check).  0 where unsupported.
+_O_CLOEXEC: int = getattr(os, "O_CLOEXEC", 0)
+_O_BINARY: int = getattr(os, "O_BINARY", 0)
+_O_NONBLOCK: int = getattr(os, "O_NONBLOCK", 0)
+_READ_FLAGS: int = os.O_RDONLY | _O_CLOEXEC | _O_BINARY | _O_NONBLOCK
+
+# Resolved workspace paths remembered per firewall instance.
+_PATH_CACHE_MAX_ENTRIES: int = 512
+
 # Actions the firewall understands.
 _VALID_ACTIONS: frozenset[str] = frozenset(
     {
@@ -88,6 +115,109 @@ _VALID_ACTIONS: frozenset[str] = frozenset(
         "read_file_paged",
     }
 )
+# Sorted once for the unknown-action error message.
+_VALID_ACTIONS_SORTED: tuple[str, ...] = tuple(sorted(_VALID_ACTIONS))
+
+
+def _fast_path_check(path: str) -> None:
+    """Reject hostile path shapes with plain string scans.
+
+    Empty paths, null bytes and ``..`` segments are refused before any
+    sanitising, ``Path`` parsing or ``resolve()`` syscalls; every path
+    that passes still goes through the full ``guard_path_traversal``.
+
+    Raises:
+        SecurityError: If the path is empty or contains a null byte or
+            a ``..`` segment.
+
+    """
+    if not path:
+        # Path("") is the workspace root itself, never a file target.
+        raise SecurityError("Empty path", guard_name="path_traversal", value="")
+    if "\x00" in path:
+        raise SecurityError(
+            "Null byte in path",
+            guard_name="path_traversal",
+            value=path.replace("\x00", "\\x00")[:50],
+        )
+    if ".." in path and ".." in path.replace("\\", "/").split("/"):
+        raise SecurityError(
+            "Path traversal pattern detected: ..",
+            guard_name="path_traversal",
+            value=path[:50],
+        )
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of *data* to *fd*, looping over short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _read_umask() -> int:
+    """Return the process umask (it can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: probing the umask briefly sets it to 0, which
+# must not race with other threads creating files.
+_UMASK: int = _read_umask()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so readers never see a partial file.
+
+    The bytes go to a temp file in the same directory, are fsynced, and
+    the temp file is renamed over *path* (atomic on POSIX and Windows).
+    The temp file is removed if anything fails.  An existing file keeps
+    its permission bits; a new one gets ``0o666 & ~umask``, as
+    ``open()`` would give it.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".bgtmp-")
+    try:
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)  # mkstemp creates files as 0o600
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _read_utf8(fd: int, size: int) -> str:
+    """Read at most *size* bytes from *fd* and decode them as UTF-8.
+
+    Reads in bounded chunks through an incremental decoder, so binary
+    data fails fast on the first bad chunk instead of after buffering
+    the whole file.
+
+    Raises:
+        UnicodeDecodeError: If the data is not valid UTF-8.
+
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts: list[str] = []
+    remaining = size
+    while remaining > 0:
+        chunk = os.read(fd, min(remaining, _READ_CHUNK_BYTES))
+        if not chunk:
+            break
+        parts.append(decoder.decode(chunk))
+        remaining -= len(chunk)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 
 class BasalGuardCore:
@@ -112,7 +242,7 @@ class BasalGuardCore:
         self,
         workspace_root: str | Path,
         *,
-        command_allowlist: frozenset[str] | None = None,
+        command_allowlist: Iterable[str] | None = None,
     ) -> None:
         """Initialise the firewall around a workspace directory.
 
@@ -121,23 +251,76 @@ class BasalGuardCore:
                             Created automatically if it does not exist.
             command_allowlist: Override the default command allowlist.
                               If ``None``, ``DEFAULT_COMMAND_ALLOWLIST``
-                              is used.
+                              is used.  Frozen once here, so later
+                              changes to a caller's ``set`` cannot widen
+                              the policy; a ``frozenset`` is used as-is.
 
         Raises:
             OSError: If the workspace directory cannot be created.
 
         """
         self.workspace_root: Path = Path(workspace_root).resolve()
-        self.command_allowlist: frozenset[str] = (
-            command_allowlist
-            if command_allowlist is not None
-            else DEFAULT_COMMAND_ALLOWLIST
-        )
+        if command_allowlist is None:
+            command_allowlist = DEFAULT_COMMAND_ALLOWLIST
+        elif not isinstance(command_allowlist, frozenset):
+            command_allowlist = frozenset(command_allowlist)
+        self.command_allowlist: frozenset[str] = command_allowlist
+        # Sequence form expected by TaipanStack, built once (a tuple, so
+        # the callee cannot mutate the shared copy).
+        self._allowed_commands: tuple[str, ...] = tuple(self.command_allowlist)
+
+        # Memo of paths that passed guard_path_traversal → resolved path.
+        self._path_cache: dict[str, Path] = {}
+        self._path_cache_lock = threading.Lock()
+
+        # Directories known to exist, so writes skip a redundant mkdir.
+        self._known_dirs: set[Path] = {self.workspace_root}
+
+        # Action name → bound handler; validate_intent is one dict lookup.
+        self._dispatch: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "write_file": self._handle_write_file,
+            "read_file": self._handle_read_file,
+            "execute_command": self._handle_execute_command,
+            "web_request": self._handle_web_request,
+            "search_in_file": self._handle_search_in_file,
+            "read_file_paged": self._handle_read_file_paged,
+        }
+
+        # Pooled HTTP clients, created on the first web_request.
+        self._http_client: httpx.Client | None = None
+        self._http_lock = threading.Lock()
+        self._async_http_client: httpx.AsyncClient | None = None
 
         # Create workspace safely (exist_ok avoids race conditions).
         self.workspace_root.mkdir(parents=True, exist_ok=True)
         logger.info("BasalGuard initialised — workspace: %s", self.workspace_root)
 
+    # ── Path resolution ──────────────────────────────────────────────
+
+    def _resolve(self, path: str) -> Path:
+        """Run ``guard_path_traversal`` against the workspace, memoised.
+
+        Only successful resolutions are cached; rejected paths raise
+        ``SecurityError`` every time.  The cache is bounded (oldest entry
+        evicted first) and dropped after every command execution.
+        """
+        cached = self._path_cache.get(path)
+        if cached is not None:
+            return cached
+
+        resolved = guard_path_traversal(path, base_dir=self.workspace_root)
+        with self._path_cache_lock:
+            if len(self._path_cache) >= _PATH_CACHE_MAX_ENTRIES:
+                self._path_cache.pop(next(iter(self._path_cache)))
+            self._path_cache[path] = resolved
+        return resolved
+
+    def _forget_filesystem_state(self) -> None:
+        """Drop everything cached about the workspace's layout."""
+        with self._path_cache_lock:
+            self._path_cache.clear()
+        self._known_dirs.clear()
+
     # ── Safe File Write ──────────────────────────────────────────────
 
     def safe_write_file(self, path: str, content: str) -> dict[str, Any]:
@@ -159,6 +342,9 @@ class BasalGuardCore:
 
         """
         try:
+            # 0. Cheap string checks before any path work.
+            _fast_path_check(path)
+
             # 1. Sanitise the *filename* part only (keep directory structure).
             file_path = Path(path)
             safe_name = sanitize_filename(file_path.name)
@@ -169,23 +355,25 @@ class BasalGuardCore:
             )
 
             # 2. Guard: ensure the resolved path stays within workspace.
-            resolved = guard_path_traversal(
-                sanitised_path,
-                base_dir=self.workspace_root,
-            )
+            resolved = self._resolve(sanitised_path)
 
-            # 3. Create parent directories if needed.
-            resolved.parent.mkdir(parents=True, exist_ok=True)
+            # 3. Create parent directories if needed (once per directory).
+            parent = resolved.parent
+            if parent not in self._known_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(parent)
 
-            # 4. Write the file.
-            resolved.write_text(content, encoding="utf-8")
+            # 4. Write the file atomically (encoded once; length reused).
+            data = content.encode("utf-8")
+            _atomic_write(resolved, data)
 
-            logger.info("File written: %s", resolved)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("File written: %s", resolved)
             return {
                 "status": "success",
                 "action": "write_file",
                 "path": str(resolved),
-                "bytes_written": len(content.encode("utf-8")),
+                "bytes_written": len(data),
             }
 
         except SecurityError as exc:
@@ -224,44 +412,67 @@ class BasalGuardCore:
 
         """
         try:
-            # 1. Guard: ensure the resolved path stays within workspace.
-            resolved = guard_path_traversal(
-                path,
-                base_dir=self.workspace_root,
-            )
-
-            # 2. Verify existence.
-            if not resolved.exists():
+            # 1. Guard: ensure the resolved path stays within workspace
+            #    (cheap string checks first).
+            _fast_path_check(path)
+            resolved = self._resolve(path)
+
+            # 2. Verify existence (open + fstat on one descriptor).
+            try:
+                fd = os.open(resolved, _READ_FLAGS)
+            except FileNotFoundError:
                 return {
                     "status": "error",
                     "action": "read_file",
                     "reason": f"File not found: {path}",
                 }
-
-            if not resolved.is_file():
+            except PermissionError:
+                if not resolved.is_dir():  # Windows refuses to open dirs
+                    raise
                 return {
                     "status": "error",
                     "action": "read_file",
                     "reason": f"Path is not a file: {path}",
                 }
 
-            # Size check to prevent reading huge files.
-            size = resolved.stat().st_size
-            if size > _MAX_READ_SIZE_BYTES:
+            try:
+                st = os.fstat(fd)
+                if not stat.S_ISREG(st.st_mode):
+                    return {
+                        "status": "error",
+                        "action": "read_file",
+                        "reason": f"Path is not a file: {path}",
+                    }
+
+                # Size check to prevent reading huge files.
+                size = st.st_size
+                if size > _MAX_READ_SIZE_BYTES:
+                    return {
+                        "status": "blocked",
+                        "action": "read_file",
+                        "reason": (
+                            f"File too large ({size} bytes). "
+                            f"Max: {_MAX_READ_SIZE_BYTES} bytes."
+                        ),
+                        "violator": path,
+                    }
+
+                # 3. Read the file (never more than the size checked above).
+                text = _read_utf8(fd, size)
+            except UnicodeDecodeError:
                 return {
-                    "status": "blocked",
+                    "status": "error",
                     "action": "read_file",
-                    "reason": (
-                        f"File too large ({size} bytes). "
-                        f"Max: {_MAX_READ_SIZE_BYTES} bytes."
-                    ),
-                    "violator": path,
+                    "reason": f"File is not valid UTF-8 text: {path}",
                 }
+            finally:
+                os.close(fd)
 
-            # 3. Read the file.
-            content = resolved.read_text(encoding="utf-8")
+            # Universal newlines, as ``read_text`` applied before.
+            content = text.replace("\r\n", "\n").replace("\r", "\n")
 
-            logger.info("File read: %s (%d bytes)", resolved, size)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("File read: %s (%d bytes)", resolved, size)
             return {
                 "status": "success",
                 "action": "read_file",
@@ -401,25 +612,21 @@ class BasalGuardCore:
 
         """
         try:
-            # 1-2. Validate injection + allowlist in one step.
-            guard_command_injection(
-                command_parts,
-                allowed_commands=list(self.command_allowlist),
-            )
-
-            # 3. Execute the command safely inside the workspace.
+            # 1-3. run_safe_command applies guard_command_injection with
+            #      the allowlist itself, then executes inside the workspace.
             result: SafeCommandResult = run_safe_command(
                 command_parts,
                 cwd=self.workspace_root,
-                allowed_commands=list(self.command_allowlist),
+                allowed_commands=self._allowed_commands,
                 timeout=60.0,
             )
 
-            logger.info(
-                "Command executed: %s (rc=%d)",
-                " ".join(command_parts),
-                result.returncode,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Command executed: %s (rc=%d)",
+                    " ".join(command_parts),
+                    result.returncode,
+                )
             return {
                 "status": "success",
                 "action": "execute_command",
@@ -446,6 +653,10 @@ class BasalGuardCore:
                 "reason": str(exc),
                 "violator": command_parts[0] if command_parts else "",
             }
+        finally:
+            # A command can rearrange the workspace (e.g. swap a directory
+            # for a symlink), so nothing resolved before it can be trusted.
+            self._forget_filesystem_state()
 
     # ── Intent Router (Central Entry-Point) ──────────────────────────
 
@@ -476,76 +687,108 @@ class BasalGuardCore:
             A dict with at minimum ``{"status": "success"|"blocked"|"error"}``.
 
         """
-        if action not in _VALID_ACTIONS:
+        handler = self._dispatch.get(action)
+        if handler is None:
             return {
                 "status": "error",
                 "reason": (
-                    f"Unknown action '{action}'. "
-                    f"Valid actions: {sorted(_VALID_ACTIONS)}"
+                    f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_SORTED}"
                 ),
             }
+        return handler(params)
 
-        if action == "write_file":
-            path = params.get("path")
-            content = params.get("content")
-            if not isinstance(path, str) or content is None:
-                return {
-                    "status": "error",
-                    "reason": (
-                        "Action 'write_file' requires string 'path' "
-                        "and 'content' parameters."
-                    ),
-                }
-            return self.safe_write_file(path, str(content))
+    # ── Action handlers (parameter checks + routing) ─────────────────
 
-        if action == "read_file":
-            path = params.get("path")
-            if not isinstance(path, str):
-                return {
-                    "status": "error",
-                    "reason": (
-                        "Action 'read_file' requires a string 'path' parameter."
-                    ),
-                }
-            return self.safe_read_file(path)
+    def _handle_write_file(self, params: dict[str, Any]) -> dict[str, Any]:
+        path = params.get("path")
+        content = params.get("content")
+        if not isinstance(path, str) or content is None:
+            return {
+                "status": "error",
+                "reason": (
+                    "Action 'write_file' requires string 'path' "
+                    "and 'content' parameters."
+                ),
+            }
+        return self.safe_write_file(path, str(content))
 
-        if action == "execute_command":
-            command_parts = params.get("command_parts")
-            if not isinstance(command_parts, list) or not command_parts:
-                return {
-                    "status": "error",
-                    "reason": (
-                        "Action 'execute_command' requires a non-empty "
-                        "'command_parts' list."
-                    ),
-                }
-            return self.safe_execute_command(command_parts)
+    def _handle_read_file(self, params: dict[str, Any]) -> dict[str, Any]:
+        path = params.get("path")
+        if not isinstance(path, str):
+            return {
+                "status": "error",
+                "reason": "Action 'read_file' requires a string 'path' parameter.",
+            }
+        return self.safe_read_file(path)
 
-        if action == "search_in_file":
-            path = params.get("path")
-            pattern = params.get("pattern")
-            if not isinstance(path, str) or not isinstance(pattern, str):
-                return {
-                    "status": "error",
-                    "reason": "Action 'search_in_file' requires string 'path' and 'pattern' parameters.",
-                }
-            case_sensitive = params.get("case_sensitive", False)
-            return self.safe_search_in_file(
-                path, pattern, case_sensitive=bool(case_sensitive)
-            )
+    def _handle_execute_command(self, params: dict[str, Any]) -> dict[str, Any]:
+        command_parts = params.get("command_parts")
+        if not isinstance(command_parts, list) or not command_parts:
+            return {
+                "status": "error",
+                "reason": (
+                    "Action 'execute_command' requires a non-empty "
+                    "'command_parts' list."
+                ),
+            }
+        return self.safe_execute_command(command_parts)
 
-        if action == "read_file_paged":
-            path = params.get("path")
-            if not isinstance(path, str):
-                return {
-                    "status": "error",
-                    "reason": "Action 'read_file_paged' requires string 'path' parameter.",
-                }
-            offset = params.get("offset", 0)
-            limit = params.get("limit", 2000)
-            return self.safe_read_file_paged(path, offset=int(offset), limit=int(limit))
+    def _handle_search_in_file(self, params: dict[str, Any]) -> dict[str, Any]:
+        path = params.get("path")
+        pattern = params.get("pattern")
+        if not isinstance(path, str) or not isinstance(pattern, str):
+            return {
+                "status": "error",
+                "reason": "Action 'search_in_file' requires string 'path' and 'pattern' parameters.",
+            }
+        case_sensitive = params.get("case_sensitive", False)
+        return self.safe_search_in_file(
+            path, pattern, case_sensitive=bool(case_sensitive)
+        )
 
-        # action == "web_request"
+    def _handle_read_file_paged(self, params: dict[str, Any]) -> dict[str, Any]:
+        path = params.get("path")
+        if not isinstance(path, str):
+            return {
+                "status": "error",
+                "reason": "Action 'read_file_paged' requires string 'path' parameter.",
+            }
+        offset = params.get("offset", 0)
+        limit = params.get("limit", 2000)
+        return self.safe_read_file_paged(path, offset=int(offset), limit=int(limit))
+
+    def _handle_web_request(self, params: dict[str, Any]) -> dict[str, Any]:
+        checked = self._web_request_params(params)
+        if isinstance(checked, dict):
+            return checked
+        url, method = checked
+        return self.safe_web_request(url, method=method)
+
+    async def validate_intent_async(
+        self,
+        action: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Async variant of :meth:`validate_intent`.
+
+        ``web_request`` runs on the pooled ``httpx.AsyncClient`` so several
+        requests can be awaited concurrently; every other action is local
+        and is delegated to :meth:`validate_intent` unchanged.
+
+        """
+        if action != "web_request":
+            return self.validate_intent(action, params)
+        checked = self._web_request_params(params)
+        if isinstance(checked, dict):
+            return checked
+        url, method = checked
+        return await self.safe_web_request_async(url, method=method)
+
+    @staticmethod
+    def _web_request_params(
+        params: dict[str, Any],
+    ) -> tuple[str, str] | dict[str, Any]:
+        """Extract ``(url, method)`` for web_request, or an error dict."""
         url = params.get("url")
         if not isinstance(url, str) or not url:
             return {
@@ -554,8 +797,7 @@ class BasalGuardCore:
                     "Action 'web_request' requires a non-empty 'url' string parameter."
                 ),
             }
-        method = params.get("method", "GET")
-        return self.safe_web_request(url, method=str(method))
+        return url, str(params.get("method", "GET"))
 
     # ── Safe Web Request ─────────────────────────────────────────────
 
@@ -568,8 +810,10 @@ class BasalGuardCore:
 
         Steps:
             1. Validate the URL (block private IPs / SSRF).
-            2. Execute the HTTP request with a short timeout.
-            3. Truncate the response body to prevent memory abuse.
+            2. Execute the HTTP request with a short timeout, reusing
+               the firewall's keep-alive connection pool.
+            3. Stream at most ``_MAX_RESPONSE_BODY`` bytes of the body,
+               so an oversized response cannot exhaust memory.
 
         Args:
             url: The target URL to request.
@@ -579,6 +823,63 @@ class BasalGuardCore:
             A dict with ``"status"`` equal to ``"success"`` or
             ``"blocked"``, plus ``"content"`` on success.
 
+        """
+        checked = self._web_request_preflight(url, method)
+        if isinstance(checked, dict):
+            return checked
+        method, validated = checked
+
+        try:
+            with self._get_http_client().stream(method, validated) as response:
+                body = bytearray()
+                for chunk in response.iter_bytes():
+                    body += chunk[: _MAX_RESPONSE_BODY - len(body)]
+                    if len(body) >= _MAX_RESPONSE_BODY:
+                        break
+        except httpx.HTTPError as exc:
+            return self._web_request_error(url, exc)
+        return self._web_request_success(method, validated, response, body)
+
+    async def safe_web_request_async(
+        self,
+        url: str,
+        method: str = "GET",
+    ) -> dict[str, Any]:
+        """Async variant of :meth:`safe_web_request`.
+
+        Same validation and result format; the DNS-based SSRF check runs
+        in a worker thread and the request uses a pooled
+        ``httpx.AsyncClient``, so concurrent calls overlap their latency.
+
+        """
+        checked = await asyncio.to_thread(self._web_request_preflight, url, method)
+        if isinstance(checked, dict):
+            return checked
+        method, validated = checked
+
+        client = self._get_async_http_client()
+        try:
+            async with client.stream(method, validated) as response:
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk[: _MAX_RESPONSE_BODY - len(body)]
+                    if len(body) >= _MAX_RESPONSE_BODY:
+                        break
+        except httpx.HTTPError as exc:
+            return self._web_request_error(url, exc)
+        return self._web_request_success(method, validated, response, body)
+
+    @staticmethod
+    def _web_request_preflight(
+        url: str,
+        method: str,
+    ) -> tuple[str, str] | dict[str, Any]:
+        """Check the method and SSRF-validate *url*.
+
+        Returns:
+            ``(method, validated_url)`` if the request may proceed,
+            otherwise the ``"blocked"`` result dict.
+
         """
         method = method.upper()
         if method not in {"GET", "HEAD"}:
@@ -593,7 +894,7 @@ class BasalGuardCore:
             }
 
         try:
-            validated = validate_url(url)
+            return method, validate_url(url)
         except SecurityError as exc:
             logger.warning("BLOCKED web_request — %s", exc)
             return {
@@ -603,15 +904,24 @@ class BasalGuardCore:
                 "violator": url,
             }
 
-        try:
-            with httpx.Client(
-                timeout=_HTTP_TIMEOUT_SECONDS,
-                follow_redirects=True,
-                max_redirects=5,
-            ) as client:
-                response = client.request(method, validated)
+    @staticmethod
+    def _web_request_success(
+        method: str,
+        validated: str,
+        response: httpx.Response,
+        body: bytearray,
+    ) -> dict[str, Any]:
+        """Build the success result from the (possibly truncated) body.
 
-            body = response.text[:_MAX_RESPONSE_BODY]
+        The body is decoded with the response charset.  When it was cut
+        at ``_MAX_RESPONSE_BODY`` a trailing partial character is dropped
+        rather than turned into a replacement character.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+            errors="replace"
+        )
+        content = decoder.decode(body, final=len(body) < _MAX_RESPONSE_BODY)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "web_request %s %s → %d (%d bytes)",
                 method,
@@ -619,28 +929,80 @@ class BasalGuardCore:
                 response.status_code,
                 len(body),
             )
-            return {
-                "status": "success",
-                "action": "web_request",
-                "url": validated,
-                "method": method,
-                "status_code": response.status_code,
-                "content": body,
-            }
-        except httpx.TimeoutException:
+        return {
+            "status": "success",
+            "action": "web_request",
+            "url": validated,
+            "method": method,
+            "status_code": response.status_code,
+            "content": content,
+        }
+
+    @staticmethod
+    def _web_request_error(url: str, exc: httpx.HTTPError) -> dict[str, Any]:
+        """Map an httpx failure to an error result."""
+        if isinstance(exc, httpx.TimeoutException):
             return {
                 "status": "error",
                 "action": "web_request",
                 "reason": f"Request timed out after {_HTTP_TIMEOUT_SECONDS}s",
                 "violator": url,
             }
-        except httpx.HTTPError as exc:
-            return {
-                "status": "error",
-                "action": "web_request",
-                "reason": f"HTTP error: {exc}",
-                "violator": url,
-            }
+        return {
+            "status": "error",
+            "action": "web_request",
+            "reason": f"HTTP error: {exc}",
+            "violator": url,
+        }
+
+    def _get_http_client(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use."""
+        client = self._http_client
+        if client is None:
+            with self._http_lock:
+                client = self._http_client
+                if client is None:
+                    client = httpx.Client(
+                        timeout=_HTTP_TIMEOUT_SECONDS,
+                        follow_redirects=True,
+                        max_redirects=5,
+                        limits=_HTTP_LIMITS,
+                    )
+                    # Safety net for callers that never close the firewall.
+                    atexit.register(client.close)
+                    self._http_client = client
+        return client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client, creating it on first use.
+
+        The client belongs to the event loop that first uses it; call
+        :meth:`aclose` before that loop shuts down.
+
+        """
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                timeout=_HTTP_TIMEOUT_SECONDS,
+                follow_redirects=True,
+                max_redirects=5,
+                limits=_HTTP_LIMITS,
+            )
+        return self._async_http_client
+
+    async def aclose(self) -> None:
+        """Release both the async and the sync HTTP connection pools."""
+        client, self._async_http_client = self._async_http_client, None
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled HTTP connections.  Safe to call more than once."""
+        with self._http_lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            atexit.unregister(client.close)
+            client.close()
 
     # ── Utility: project-name validation (bonus) ─────────────────────
 
@@ -672,6 +1034,18 @@ class BasalGuardCore:
 
     # ── Dunder helpers ───────────────────────────────────────────────
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     def __repr__(self) -> str:
         return (
             f"BasalGuardCore(workspace_root={self.workspace_root!r}, "
@@ -0,0 +1 @@
+"""BasalGuard demos — runnable showcases of the firewall."""
@@ -1,34 +1,24 @@
-#!/usr/bin/env python3
 """BasalGuard — Proof-of-Concept Demo.
 
 Simulates an AI agent loop where a mock LLM emits JSON intents and
 BasalGuard deterministically allows or blocks each one.
 
-Run from the project root::
+Run after installing the project (``poetry install``)::
 
-    PYTHONPATH=src/taipanstack_repo/src:src python3 demo_agent_loop.py
+    basalguard-demo
 
+The demo workspace is created as ``safe_playground`` in the current
+directory.
 """
 
 from __future__ import annotations
 
 import json
 import sys
-import textwrap
 from pathlib import Path
 from typing import Any
 
-# ── Ensure PYTHONPATH includes the required source trees ─────────────
-_ROOT = Path(__file__).resolve().parent
-for _p in (
-    _ROOT / "src" / "taipanstack_repo" / "src",  # TaipanStack
-    _ROOT / "src",  # BasalGuard
-):
-    if str(_p) not in sys.path:
-        sys.path.insert(0, str(_p))
-
-from basalguard.core.agent_firewall import BasalGuardCore  # noqa: E402
-
+from basalguard.core.agent_firewall import BasalGuardCore
 
 # ── ANSI colour helpers (stdlib only) ────────────────────────────────
 
@@ -55,25 +45,77 @@ class _C:
 
 
 # Disable colours when piped or on Windows without ANSI support.
-if not sys.stdout.isatty():
+_COLOUR = sys.stdout.isatty()
+if not _COLOUR:
     _C.disable()
 
+# Bare module-level names: one global lookup per use instead of an attribute.
+RESET = _C.RESET
+BOLD = _C.BOLD
+DIM = _C.DIM
+RED = _C.RED
+GREEN = _C.GREEN
+YELLOW = _C.YELLOW
+CYAN = _C.CYAN
+WHITE = _C.WHITE
+BG_RED = _C.BG_RED
+BG_GRN = _C.BG_GRN
+
+# Constant decorations — built once, after the colour decision above.
+_SEP = f"{BOLD}{WHITE}{'─' * 62}{RESET}"
+_SUBSEP = f"{WHITE}{'─' * 62}{RESET}"
+_TRIED = f"\n  🔴 {YELLOW}IA Tentou:{RESET}\n"
+_BADGE_OK = f"{BG_GRN}{BOLD} ✅ PERMITIDO {RESET}"
+_BADGE_BLOCKED = f"{BG_RED}{BOLD} 🛡️  BLOQUEADO {RESET}"
+_RESPONDED = f"  {CYAN}BasalGuard Respondeu:{RESET}\n"
+
+# Constant blocks pre-encoded once; they bypass the text layer entirely.
+_BANNER = f"""
+{BOLD}{CYAN}╔══════════════════════════════════════════════════════════════╗
+║          🐍  BasalGuard — Agent Firewall Demo  🛡️            ║
+║  Prova de Conceito: LLM simulada vs. Firewall determinístico ║
+╚══════════════════════════════════════════════════════════════╝{RESET}
+
+""".encode()
+_DOUBLE_SEP = f"{BOLD}{WHITE}{'═' * 62}{RESET}\n".encode()
+
+
+try:
+    import orjson
+
+    def _pretty_json(obj: Any) -> str:
+        """Return a compact, indented JSON string."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
 
-def _pretty_json(obj: Any) -> str:
-    """Return a compact, indented JSON string."""
-    return json.dumps(obj, indent=2, ensure_ascii=False)
+except ImportError:
+
+    def _pretty_json(obj: Any) -> str:
+        """Return a compact, indented JSON string."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _write(data: bytes) -> None:
+    """Write pre-encoded UTF-8 straight to stdout's binary buffer."""
+    out = sys.stdout
+    out.flush()  # keep ordering with anything written as text
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode())
+    else:
+        buffer.write(data)
+
+
+def _indent(s: str, n: int = 5) -> str:
+    """Prefix every line of *s* with *n* spaces."""
+    pad = " " * n
+    return pad + s.replace("\n", "\n" + pad)
 
 
 def _print_header() -> None:
-    print(f"""
-{_C.BOLD}{_C.CYAN}╔══════════════════════════════════════════════════════════════╗
-║          🐍  BasalGuard — Agent Firewall Demo  🛡️            ║
-║  Prova de Conceito: LLM simulada vs. Firewall determinístico ║
-╚══════════════════════════════════════════════════════════════╝{_C.RESET}
-""")
+    _write(_BANNER)
 
 
-def _print_scenario(
+def _colour_print_scenario(
     index: int,
     title: str,
     intent: dict[str, Any],
@@ -83,36 +125,46 @@ def _print_scenario(
     status = result.get("status", "unknown")
     is_ok = status == "success"
 
-    # ── Scenario header ──
-    colour = _C.GREEN if is_ok else _C.RED
+    colour = GREEN if is_ok else RED
     tag = "LEGÍTIMO" if is_ok else "ATAQUE"
-    print(
-        f"{_C.BOLD}{_C.WHITE}{'─' * 62}{_C.RESET}\n"
-        f"{_C.BOLD}  Cenário {index}  "
-        f"{colour}[{tag}]{_C.RESET}  {_C.DIM}{title}{_C.RESET}\n"
-        f"{_C.WHITE}{'─' * 62}{_C.RESET}"
+    badge = _BADGE_OK if is_ok else _BADGE_BLOCKED
+
+    # Header, what the AI tried and BasalGuard's response — one write.
+    sys.stdout.write(
+        f"{_SEP}\n"
+        f"{BOLD}  Cenário {index}  "
+        f"{colour}[{tag}]{RESET}  {DIM}{title}{RESET}\n"
+        f"{_SUBSEP}\n"
+        f"{_TRIED}"
+        f"{_indent(_pretty_json(intent))}\n"
+        f"\n  {badge}{_RESPONDED}"
+        f"{_indent(_pretty_json(result))}\n\n"
     )
 
-    # ── What the AI tried ──
-    intent_json = _pretty_json(intent)
-    print(
-        f"\n  🔴 {_C.YELLOW}IA Tentou:{_C.RESET}\n"
-        f"{textwrap.indent(intent_json, '     ')}"
-    )
 
-    # ── BasalGuard response ──
-    if is_ok:
-        badge = f"{_C.BG_GRN}{_C.BOLD} ✅ PERMITIDO {_C.RESET}"
-    else:
-        badge = f"{_C.BG_RED}{_C.BOLD} 🛡️  BLOQUEADO {_C.RESET}"
+def _plain_print_scenario(
+    index: int,
+    title: str,
+    intent: dict[str, Any],
+    result: dict[str, Any],
+) -> None:
+    """Colour-free :func:`_colour_print_scenario` for piped output."""
+    is_ok = result.get("status", "unknown") == "success"
+    tag = "LEGÍTIMO" if is_ok else "ATAQUE"
+    badge = _BADGE_OK if is_ok else _BADGE_BLOCKED
 
-    result_json = _pretty_json(result)
-    print(
-        f"\n  {badge}  {_C.CYAN}BasalGuard Respondeu:{_C.RESET}\n"
-        f"{textwrap.indent(result_json, '     ')}\n"
+    sys.stdout.write(
+        f"{_SEP}\n  Cenário {index}  [{tag}]  {title}\n{_SUBSEP}\n{_TRIED}"
+        f"{_indent(_pretty_json(intent))}\n"
+        f"\n  {badge}{_RESPONDED}"
+        f"{_indent(_pretty_json(result))}\n\n"
     )
 
 
+# Specialise once for the colour decision instead of interpolating empty codes.
+_print_scenario = _colour_print_scenario if _COLOUR else _plain_print_scenario
+
+
 # ── Main demo loop ──────────────────────────────────────────────────
 
 
@@ -120,12 +172,12 @@ def main() -> None:
     """Run the demo scenarios."""
     _print_header()
 
-    playground = _ROOT / "safe_playground"
+    playground = Path.cwd() / "safe_playground"
     firewall = BasalGuardCore(playground)
 
     print(
-        f"  ⚙️  Workspace: {_C.BOLD}{firewall.workspace_root}{_C.RESET}\n"
-        f"  ⚙️  Allowlist: {_C.DIM}{sorted(firewall.command_allowlist)}{_C.RESET}\n"
+        f"  ⚙️  Workspace: {BOLD}{firewall.workspace_root}{RESET}\n"
+        f"  ⚙️  Allowlist: {DIM}{sorted(firewall.command_allowlist)}{RESET}\n"
     )
 
     # ── Cenários simulados ───────────────────────────────────────────
@@ -183,17 +235,23 @@ def main() -> None:
             blocked_count += 1
 
     # ── Summary ──────────────────────────────────────────────────────
-    print(f"{_C.BOLD}{_C.WHITE}{'═' * 62}{_C.RESET}")
-    print(
-        f"  📊 {_C.BOLD}Resumo:{_C.RESET}  "
-        f"{_C.GREEN}✅ {allowed_count} permitidos{_C.RESET}  │  "
-        f"{_C.RED}🛡️  {blocked_count} bloqueados{_C.RESET}"
-    )
-    print(
-        f"\n  {_C.DIM}BasalGuard protegeu o sistema de "
-        f"{blocked_count} ação(ões) perigosa(s).{_C.RESET}"
+    _write(
+        b"".join(
+            [
+                _DOUBLE_SEP,
+                (
+                    f"  📊 {BOLD}Resumo:{RESET}  "
+                    f"{GREEN}✅ {allowed_count} permitidos{RESET}  │  "
+                    f"{RED}🛡️  {blocked_count} bloqueados{RESET}\n"
+                    f"\n  {DIM}BasalGuard protegeu o sistema de "
+                    f"{blocked_count} ação(ões) perigosa(s).{RESET}\n"
+                ).encode(),
+                _DOUBLE_SEP,
+                b"\n",
+            ]
+        )
     )
-    print(f"{_C.BOLD}{_C.WHITE}{'═' * 62}{_C.RESET}\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
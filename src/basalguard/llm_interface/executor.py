@@ -22,14 +22,27 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from basalguard.core.agent_firewall import BasalGuardCore
+from basalguard.llm_interface.tool_schemas import validate_tool_args
+from taipanstack.security.guards import SecurityError
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger("basalguard.executor")
 
+_loads: Callable[[str], Any] = orjson.loads if HAS_ORJSON else json.loads
+
 # Map from tool name (as the LLM sees it) → BasalGuard action name.
 _TOOL_TO_ACTION: dict[str, str] = {
     "write_file": "write_file",
@@ -39,6 +52,8 @@ _TOOL_TO_ACTION: dict[str, str] = {
     "search_in_file": "search_in_file",
     "read_file_paged": "read_file_paged",
 }
+# Sorted once for the unknown-tool error message.
+_AVAILABLE_TOOLS_SORTED: tuple[str, ...] = tuple(sorted(_TOOL_TO_ACTION))
 
 
 class ToolExecutor:
@@ -86,29 +101,22 @@ class ToolExecutor:
             was blocked, or errored.
 
         """
-        action = _TOOL_TO_ACTION.get(tool_name)
-
-        if action is None:
-            result = {
-                "status": "error",
-                "reason": (
-                    f"Unknown tool '{tool_name}'. "
-                    f"Available tools: {sorted(_TOOL_TO_ACTION.keys())}"
-                ),
-            }
-            logger.warning("Unknown tool call: %s", tool_name)
-            return self._to_json(result)
-
-        # Translate run_command arguments → validate_intent format.
-        params = self._translate_params(action, arguments)
-        result = self.firewall.validate_intent(action, params)
-
-        logger.info(
-            "Tool %s → %s (status=%s)",
-            tool_name,
-            action,
-            result.get("status"),
-        )
+        action = self._resolve_action(tool_name, arguments)
+        if isinstance(action, dict):
+            return self._to_json(action)
+
+        # The tool schemas use the firewall's own parameter names, and the
+        # handlers only read from params, so the arguments pass straight
+        # through without a defensive copy.
+        result = self.firewall.validate_intent(action, arguments)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Tool %s → %s (status=%s)",
+                tool_name,
+                action,
+                result.get("status"),
+            )
         return self._to_json(result)
 
     def execute_tool_calls(
@@ -135,52 +143,140 @@ class ToolExecutor:
             conversation (OpenAI ``role: "tool"`` format).
 
         """
-        results: list[dict[str, str]] = []
+        execute = self.execute_tool_call
+        return [
+            {
+                "role": "tool",
+                "tool_call_id": call_id,
+                "content": execute(name, arguments),
+            }
+            for call_id, name, arguments in map(self._parse_call, tool_calls)
+        ]
 
-        for call in tool_calls:
-            call_id = call.get("id", "unknown")
-            function = call.get("function", {})
-            name = function.get("name", "")
-            raw_args = function.get("arguments", "{}")
+    async def execute_tool_calls_async(
+        self,
+        tool_calls: list[dict[str, Any]],
+    ) -> list[dict[str, str]]:
+        """Execute a batch of tool calls, overlapping network I/O.
 
-            # Parse arguments (the LLM sends them as a JSON string).
-            try:
-                arguments = (
-                    json.loads(raw_args) if isinstance(raw_args, str) else raw_args
-                )
-            except json.JSONDecodeError:
-                arguments = {}
-
-            output = self.execute_tool_call(name, arguments)
-
-            results.append(
-                {
-                    "role": "tool",
-                    "tool_call_id": call_id,
-                    "content": output,
-                }
-            )
+        Same input and output as :meth:`execute_tool_calls`.  Local
+        actions (files, commands) still run one after another in call
+        order, but in a worker thread so they never block the event
+        loop.  That chain is gathered with every ``web_request``, each
+        awaited concurrently on the firewall's pooled async client, so
+        the batch costs roughly its slowest part instead of the sum.
+
+        Args:
+            tool_calls: List of tool call dicts from the LLM response.
+
+        Returns:
+            Tool result messages in the same order as ``tool_calls``.
+
+        """
+        parsed = [self._parse_call(call) for call in tool_calls]
+        outputs: list[str] = [""] * len(parsed)
+        pending: list[int] = []
+        local: list[int] = []
+
+        for index, (_, name, _) in enumerate(parsed):
+            (pending if name == "web_request" else local).append(index)
+
+        def run_local() -> None:
+            for index in local:
+                _, name, arguments = parsed[index]
+                outputs[index] = self.execute_tool_call(name, arguments)
+
+        fetched, _ = await asyncio.gather(
+            asyncio.gather(
+                *(self._execute_web_request_async(parsed[i][2]) for i in pending)
+            ),
+            asyncio.to_thread(run_local),
+        )
+        for index, output in zip(pending, fetched, strict=True):
+            outputs[index] = output
 
-        return results
+        return [
+            {"role": "tool", "tool_call_id": call_id, "content": output}
+            for (call_id, _, _), output in zip(parsed, outputs, strict=True)
+        ]
 
     # ── Internals ────────────────────────────────────────────────────
 
-    @staticmethod
-    def _translate_params(action: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        """Normalise LLM arguments to BasalGuard's internal format.
+    def _resolve_action(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> str | dict[str, Any]:
+        """Map *tool_name* to its firewall action and check the arguments.
 
-        The LLM schema uses ``command_parts`` for run_command, which
-        maps to ``command_parts`` in ``validate_intent`` as well; no
-        translation needed.  This method exists as an extensibility
-        point and for readability.
+        Returns:
+            The action name, or an error result dict if the tool is
+            unknown or the arguments violate its schema.
 
         """
-        # Direct pass-through — the schemas match the firewall's params.
-        return dict(arguments)
+        action = _TOOL_TO_ACTION.get(tool_name)
+
+        if action is None:
+            logger.warning("Unknown tool call: %s", tool_name)
+            return {
+                "status": "error",
+                "reason": (
+                    f"Unknown tool '{tool_name}'. "
+                    f"Available tools: {_AVAILABLE_TOOLS_SORTED}"
+                ),
+            }
+
+        try:
+            validate_tool_args(tool_name, arguments)
+        except SecurityError as exc:
+            logger.warning("Invalid arguments for %s: %s", tool_name, exc)
+            return {
+                "status": "error",
+                "reason": f"Invalid arguments for tool '{tool_name}': {exc}",
+            }
+
+        return action
+
+    async def _execute_web_request_async(self, arguments: dict[str, Any]) -> str:
+        """Async counterpart of ``execute_tool_call("web_request", ...)``."""
+        action = self._resolve_action("web_request", arguments)
+        if isinstance(action, dict):
+            return self._to_json(action)
+
+        result = await self.firewall.validate_intent_async(action, arguments)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Tool web_request → %s (status=%s)",
+                action,
+                result.get("status"),
+            )
+        return self._to_json(result)
+
+    @staticmethod
+    def _parse_call(call: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+        """Split a raw tool call into ``(id, name, parsed arguments)``."""
+        call_id = call.get("id", "unknown")
+        function = call.get("function", {})
+        name = function.get("name", "")
+        raw_args = function.get("arguments", "{}")
+
+        # Parse arguments (the LLM sends them as a JSON string).
+        try:
+            arguments = _loads(raw_args) if isinstance(raw_args, str) else raw_args
+        except json.JSONDecodeError:  # orjson's error subclasses this one
+            arguments = {}
+
+        return call_id, name, arguments
 
     @staticmethod
     def _to_json(result: dict[str, Any]) -> str:
         """Serialise a result dict to a compact JSON string."""
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(result, default=str).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits; stdlib copes
         return json.dumps(result, ensure_ascii=False, default=str)
 
     def __repr__(self) -> str:
@@ -1,8 +1,17 @@
 """OpenAI / Anthropic-compatible tool schemas for BasalGuard.
 
-This module exports ``BASALGUARD_TOOLS``, a list of tool definitions that
+This module exports ``BASALGUARD_TOOLS``, a tuple of tool definitions that
 can be passed directly to the ``tools`` parameter of the OpenAI Chat
-Completions API or adapted for Anthropic's Tool Use API.
+Completions API or adapted for Anthropic's Tool Use API, and
+``BASALGUARD_TOOLS_JSON``, the same list serialised to JSON bytes for
+clients that post raw request bodies.  ``BASALGUARD_VALIDATORS`` and
+``validate_tool_args`` check LLM-supplied arguments against the same
+schemas.  The JSON bytes and validators are built on first use.
+``BASALGUARD_TOOLS_BY_NAME`` maps each tool name to its definition.
+
+The schemas are shared, module-level objects: treat them as read-only.
+A caller that needs to modify one should copy it first (e.g. with
+``copy.deepcopy``).
 
 Each schema follows the **OpenAI function-calling** format::
 
@@ -28,8 +37,43 @@ Usage::
 
 from __future__ import annotations
 
+import json
+import logging
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
+from taipanstack.security.guards import SecurityError
+
+logger = logging.getLogger("basalguard.tool_schemas")
+
+# A declared dependency; the guard only covers broken installs.
+try:
+    import fastjsonschema
+
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+    logger.warning(
+        "fastjsonschema is not installed: calls to known tools will be "
+        "rejected because their arguments cannot be validated"
+    )
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# ── Shared parameters ────────────────────────────────────────────────
+# One object reused by every schema that takes a plain file path.
+
+_FILE_PATH_PARAM: dict[str, Any] = {
+    "type": "string",
+    "description": "Relative path to the file.",
+}
+
 # ── Tool: write_file ─────────────────────────────────────────────────
 
 WRITE_FILE_SCHEMA: dict[str, Any] = {
@@ -187,7 +231,9 @@ SEARCH_IN_FILE_SCHEMA: dict[str, Any] = {
         "name": "search_in_file",
         "description": (
             "Search for a text pattern in a file (grep replacement). "
-            "Reads the file line by line to support large files. "
+            "Safe on large files: small files are read whole, larger ones "
+            "are memory-mapped and scanned without loading them, and only "
+            "matching lines are returned. "
             "Path traversal attempts are BLOCKED.\n\n"
             "WHEN TO USE: When you need to find specific strings, definitions, "
             "or TODOs in a file without reading the whole file."
@@ -195,7 +241,7 @@ SEARCH_IN_FILE_SCHEMA: dict[str, Any] = {
         "parameters": {
             "type": "object",
             "properties": {
-                "path": {"type": "string", "description": "Relative path to the file."},
+                "path": _FILE_PATH_PARAM,
                 "pattern": {
                     "type": "string",
                     "description": "The text pattern to search for.",
@@ -227,7 +273,7 @@ READ_FILE_PAGED_SCHEMA: dict[str, Any] = {
         "parameters": {
             "type": "object",
             "properties": {
-                "path": {"type": "string", "description": "Relative path to the file."},
+                "path": _FILE_PATH_PARAM,
                 "offset": {
                     "type": "integer",
                     "description": "Byte offset to start reading from. Default 0.",
@@ -243,14 +289,105 @@ READ_FILE_PAGED_SCHEMA: dict[str, Any] = {
     },
 }
 
-# ── Exported list ────────────────────────────────────────────────────
+# ── Exported collections ─────────────────────────────────────────────
 
-BASALGUARD_TOOLS: list[dict[str, Any]] = [
+BASALGUARD_TOOLS: tuple[dict[str, Any], ...] = (
     WRITE_FILE_SCHEMA,
     READ_FILE_SCHEMA,
     RUN_COMMAND_SCHEMA,
     WEB_REQUEST_SCHEMA,
     SEARCH_IN_FILE_SCHEMA,
     READ_FILE_PAGED_SCHEMA,
-]
+)
 """All BasalGuard tool schemas, ready for ``tools=`` in an API call."""
+
+BASALGUARD_TOOLS_BY_NAME: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {tool["function"]["name"]: tool for tool in BASALGUARD_TOOLS}
+)
+"""Read-only view: tool name → its entry in ``BASALGUARD_TOOLS``."""
+
+# Tool name → JSON Schema of its arguments.
+_PARAMETERS_BY_NAME: dict[str, dict[str, Any]] = {
+    name: tool["function"]["parameters"]
+    for name, tool in BASALGUARD_TOOLS_BY_NAME.items()
+}
+
+# ── Lazily derived artifacts ─────────────────────────────────────────
+# Serialising the schemas and compiling validators costs more than the
+# dict literals above, so each is built on first use and then kept.
+#
+#   BASALGUARD_TOOLS_JSON  – ``BASALGUARD_TOOLS`` as JSON bytes, e.g. for
+#                            ``httpx``'s ``content=``.  Mutating the schema
+#                            dicts after first access does not update it.
+#   BASALGUARD_VALIDATORS  – tool name → compiled argument validator
+#                            (empty without fastjsonschema).
+
+_validators: dict[str, Callable[[Any], Any]] = {}
+
+
+def _validator(name: str) -> Callable[[Any], Any] | None:
+    """Return the compiled validator for tool *name*, compiling it once."""
+    validator = _validators.get(name)
+    if validator is None and HAS_FASTJSONSCHEMA:
+        schema = _PARAMETERS_BY_NAME.get(name)
+        if schema is not None:
+            validator = _validators[name] = fastjsonschema.compile(schema)
+    return validator
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``BASALGUARD_TOOLS_JSON`` / ``BASALGUARD_VALIDATORS`` on demand."""
+    value: Any
+    if name == "BASALGUARD_TOOLS_JSON":
+        value = (
+            orjson.dumps(BASALGUARD_TOOLS)
+            if HAS_ORJSON
+            else json.dumps(BASALGUARD_TOOLS, separators=(",", ":")).encode("utf-8")
+        )
+    elif name == "BASALGUARD_VALIDATORS":
+        value = {
+            tool: validator
+            for tool in _PARAMETERS_BY_NAME
+            if (validator := _validator(tool)) is not None
+        }
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+# ── Argument validation ──────────────────────────────────────────────
+
+
+def validate_tool_args(name: str, arguments: dict[str, Any]) -> None:
+    """Check *arguments* against the schema of tool *name*.
+
+    Each tool's validator is compiled by fastjsonschema into generated
+    Python the first time that tool is checked.  Unknown tool names are
+    accepted as-is; the caller reports those itself.  A known tool is
+    never waved through unchecked: without fastjsonschema the call is
+    rejected.
+
+    Args:
+        name: The tool name as the LLM sees it (e.g. ``"write_file"``).
+        arguments: The parsed arguments of the tool call.
+
+    Raises:
+        SecurityError: If the arguments violate the tool's schema, or
+            the schema cannot be checked because fastjsonschema is
+            missing.
+
+    """
+    validator = _validator(name)
+    if validator is None:
+        if name in _PARAMETERS_BY_NAME:
+            raise SecurityError(
+                "schema validation unavailable: fastjsonschema is not installed",
+                guard_name="tool_schema",
+                value=name,
+            )
+        return
+    try:
+        validator(arguments)
+    except fastjsonschema.JsonSchemaException as exc:
+        raise SecurityError(str(exc), guard_name="tool_schema", value=name) from exc
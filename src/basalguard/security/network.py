@@ -12,14 +12,30 @@ Usage::
     safe = validate_url("https://example.com")       # ✅ OK
     bad  = validate_url("http://192.168.1.1/admin")  # 💥 SecurityError
 
+Decisions and DNS answers are cached for a minute; call
+``clear_validation_cache()`` to drop them early.  For a fixed domain
+allowlist, build it once with ``normalize_allowed_domains()``.
+``validate_urls()`` checks a batch with DNS lookups in parallel, and
+``validate_url_async()`` keeps lookups off the event loop.
+
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import concurrent.futures
+import functools
 import ipaddress
 import logging
+import re
 import socket
-from urllib.parse import urlparse
+import sys
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+from urllib.parse import urlsplit
 
 from taipanstack.security.guards import SecurityError
 
@@ -36,13 +52,205 @@ class NetworkSecurityError(SecurityError):
 
 
 # ── Schemes we allow ─────────────────────────────────────────────────
-_ALLOWED_SCHEMES: frozenset[str] = frozenset({"http", "https"})
+# A two-item tuple: ``in`` tries identity first, and parsed schemes are
+# interned, so the usual check is a pointer compare with no hashing.
+_ALLOWED_SCHEMES: tuple[str, ...] = (sys.intern("https"), sys.intern("http"))
+
+# An http(s) URL whose host is a literal IPv4 address or bracketed IPv6
+# address, optionally with a port, and nothing else in the authority.
+# Anything the pattern does not cover (userinfo, backslashes, odd
+# characters) falls through to the full ``urlsplit`` path.
+_LITERAL_IP_URL = re.compile(
+    r"(?i:https?)://(?:([0-9.]+)|\[([0-9A-Fa-f:.]+)\])(?::[0-9]*)?(?=[/?#]|\Z)"
+)
+
+# ── Blocked address table ────────────────────────────────────────────
+# The policy is "is_private or is_reserved or is_loopback".  Evaluating
+# those properties walks dozens of networks per address, so the policy
+# is flattened once into sorted, disjoint [first, last] integer ranges
+# and each check becomes one bisect.
+
+
+def _policy_blocked(addr: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """The reference policy, straight from the stdlib properties."""
+    return addr.is_private or addr.is_reserved or addr.is_loopback
+
+
+def _special_networks(
+    constants: Any,
+) -> list[ipaddress.IPv4Network | ipaddress.IPv6Network]:
+    """Every network the stdlib uses to classify addresses."""
+    networks: list[ipaddress.IPv4Network | ipaddress.IPv6Network] = []
+    for value in vars(constants).values():
+        items = value if isinstance(value, list | tuple | set | frozenset) else [value]
+        networks.extend(
+            item
+            for item in items
+            if isinstance(item, ipaddress.IPv4Network | ipaddress.IPv6Network)
+        )
+    return networks
+
+
+def _blocked_ranges(version: int) -> tuple[list[int], list[int]]:
+    """Flatten the policy for IP *version* into ``(starts, ends)``.
+
+    The policy can only change value at the edge of one of the stdlib's
+    special networks, so it is evaluated once per interval between
+    consecutive edges.  That reproduces the running interpreter's
+    classification exactly, including IPv4-mapped IPv6 addresses.
+    """
+    v4_networks = _special_networks(getattr(ipaddress, "_IPv4Constants"))
+    edges = {0}
+    if version == 4:
+        make: Any = ipaddress.IPv4Address
+        size = 1 << 32
+        networks = v4_networks
+    else:
+        make = ipaddress.IPv6Address
+        size = 1 << 128
+        networks = [
+            *_special_networks(getattr(ipaddress, "_IPv6Constants")),
+            ipaddress.IPv6Network("::1/128"),
+        ]
+        mapped = int(ipaddress.IPv6Address("::ffff:0:0"))
+        edges.update((mapped, mapped + (1 << 32)))
+        for net in v4_networks:
+            edges.add(mapped + int(net.network_address))
+            edges.add(mapped + int(net.broadcast_address) + 1)
+    for net in networks:
+        edges.add(int(net.network_address))
+        edges.add(int(net.broadcast_address) + 1)
+
+    bounds = sorted(edge for edge in edges if edge < size)
+    starts: list[int] = []
+    ends: list[int] = []
+    for first, following in zip(bounds, [*bounds[1:], size], strict=True):
+        if _policy_blocked(make(first)):
+            if ends and ends[-1] == first - 1:
+                ends[-1] = following - 1
+            else:
+                starts.append(first)
+                ends.append(following - 1)
+    return starts, ends
+
+
+_BLOCKED_RANGES: dict[int, tuple[list[int], list[int]]] | None
+try:
+    _BLOCKED_RANGES = {4: _blocked_ranges(4), 6: _blocked_ranges(6)}
+except AttributeError:  # stdlib internals moved; use the properties
+    _BLOCKED_RANGES = None
+
+
+def _is_blocked(addr: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """Return whether *addr* is private, reserved or loopback."""
+    if _BLOCKED_RANGES is None:
+        return _policy_blocked(addr)
+    starts, ends = _BLOCKED_RANGES[addr.version]
+    ip = int(addr)
+    index = bisect.bisect_right(starts, ip) - 1
+    return index >= 0 and ip <= ends[index]
+
+
+# ── DNS cache ────────────────────────────────────────────────────────
+# (hostname, address family) → (resolved addresses, expiry on the
+# monotonic clock).  Only the lookup is cached; every address is still
+# classified on each call.
+_DNS_CACHE_TTL_SECONDS: float = 60.0
+_DNS_CACHE_MAX_ENTRIES: int = 1024
+_dns_cache: dict[
+    tuple[str, int],
+    tuple[tuple[ipaddress.IPv4Address | ipaddress.IPv6Address, ...], float],
+] = {}
+_dns_cache_lock = threading.Lock()
+
+# ── Result cache ─────────────────────────────────────────────────────
+# (url, normalised allowlist, family) → (None if allowed, else the
+# (message, value) of the SecurityError to re-raise; expiry).  Rejections caused
+# by a failed DNS lookup are not cached, so a transient outage does not
+# block a host for the whole TTL.
+_RESULT_CACHE_TTL_SECONDS: float = 60.0
+_RESULT_CACHE_MAX_ENTRIES: int = 4096
+_ResultKey = tuple[str, frozenset[str] | None, int]
+_result_cache: dict[_ResultKey, tuple[tuple[str, str | None] | None, float]] = {}
+_result_cache_lock = threading.Lock()
+
+
+# Shared pool for validate_urls / validate_url_async.  Threads start on
+# first use, so importing the module costs nothing.
+_DNS_POOL_WORKERS: int = 16
+_DNS_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_DNS_POOL_WORKERS, thread_name_prefix="basalguard-dns"
+)
+
+
+class _ResolutionError(SecurityError):
+    """A DNS lookup failed; the rejection is not cached."""
+
+
+def clear_validation_cache() -> None:
+    """Forget all cached ``validate_url`` decisions and DNS answers."""
+    with _result_cache_lock:
+        _result_cache.clear()
+    with _dns_cache_lock:
+        _dns_cache.clear()
+
+
+def _resolve_and_classify(
+    hostname: str,
+    family: int = socket.AF_UNSPEC,
+) -> tuple[ipaddress.IPv4Address | ipaddress.IPv6Address, ...]:
+    """Resolve *hostname* to its IP addresses, with a short-lived cache.
+
+    Only ``SOCK_STREAM`` results are requested, so the resolver returns
+    each address once rather than once per socket type.  Failed lookups
+    raise and are never cached, so an unresolvable host is retried on
+    every attempt.
+
+    Raises:
+        SecurityError: If resolution fails or returns no addresses.
+
+    """
+    now = time.monotonic()
+    hit = _dns_cache.get((hostname, family))
+    if hit is not None and hit[1] > now:
+        return hit[0]
+
+    try:
+        infos = socket.getaddrinfo(hostname, None, family, socket.SOCK_STREAM)
+    except socket.gaierror as exc:
+        raise _ResolutionError(
+            f"DNS resolution failed for '{hostname}': {exc}",
+            guard_name="network_guard",
+            value=hostname,
+        ) from exc
+
+    if not infos:
+        raise _ResolutionError(
+            f"DNS returned no results for '{hostname}'",
+            guard_name="network_guard",
+            value=hostname,
+        )
+
+    addrs: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
+    for _family, _type, _proto, _canonname, sockaddr in infos:
+        try:
+            addrs.append(ipaddress.ip_address(sockaddr[0]))
+        except ValueError:
+            continue
+
+    resolved = tuple(addrs)
+    with _dns_cache_lock:
+        if len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.pop(next(iter(_dns_cache)))  # evict the oldest entry
+        _dns_cache[hostname, family] = (resolved, now + _DNS_CACHE_TTL_SECONDS)
+    return resolved
 
 
 def validate_url(
     url: str,
     *,
-    allowed_domains: list[str] | None = None,
+    allowed_domains: Iterable[str] | None = None,
+    family: int = socket.AF_UNSPEC,
 ) -> str:
     """Validate a URL for safe external access.
 
@@ -53,10 +261,20 @@ def validate_url(
            the request is blocked.
         4. Optionally enforce a domain allowlist.
 
+    The decision for a given ``(url, allowed_domains, family)`` is cached
+    for ``_RESULT_CACHE_TTL_SECONDS``, so repeat calls are a dict lookup.
+
     Args:
         url: The raw URL string to validate.
         allowed_domains: If provided, only these domains are allowed.
-                         Case-insensitive comparison.
+                         Case-insensitive comparison.  A ``frozenset``
+                         is taken as already normalised — build it once
+                         with :func:`normalize_allowed_domains`; other
+                         iterables are normalised through a small memo.
+        family: Address family to resolve (``socket.AF_INET`` skips the
+                AAAA query).  Only narrow it if the HTTP client is pinned
+                to the same family, otherwise an unchecked address of the
+                other family could be used.  Defaults to both.
 
     Returns:
         The original URL string (unmodified) if it passes validation.
@@ -66,22 +284,165 @@ def validate_url(
             scheme, blocked domain, unresolvable hostname, etc.).
 
     """
+    key = _result_key(url, allowed_domains, family)
+    now = time.monotonic()
+    hit = _result_cache.get(key)
+    if hit is not None and hit[1] > now:
+        if hit[0] is None:
+            return url
+        message, value = hit[0]
+        raise SecurityError(message, guard_name="network_guard", value=value)
+
+    try:
+        _check_url(url, key[1], family)
+    except _ResolutionError:
+        raise
+    except SecurityError as exc:
+        message = str(exc).removeprefix("[network_guard] ")
+        _remember_result(key, (message, exc.value), now)
+        raise
+    _remember_result(key, None, now)
+    return url
+
+
+def validate_urls(
+    urls: Sequence[str],
+    *,
+    allowed_domains: Iterable[str] | None = None,
+    family: int = socket.AF_UNSPEC,
+) -> list[str | SecurityError]:
+    """Validate several URLs, resolving uncached hosts in parallel.
+
+    URLs with a cached decision are answered inline; the rest run
+    :func:`validate_url` on a shared pool of ``_DNS_POOL_WORKERS``
+    threads, so their DNS lookups overlap.
+
+    Returns:
+        One entry per input URL, in order: the URL if it passed, or the
+        ``SecurityError`` it raised.
+
+    """
+    allowed = _result_key("", allowed_domains, family)[1]
+    now = time.monotonic()
+    results: dict[str, str | SecurityError] = {}
+    pending: dict[str, concurrent.futures.Future[str | SecurityError]] = {}
+    for url in dict.fromkeys(urls):
+        hit = _result_cache.get((url, allowed, family))
+        if hit is not None and hit[1] > now:
+            results[url] = _validate_or_error(url, allowed, family)
+        else:
+            pending[url] = _DNS_POOL.submit(_validate_or_error, url, allowed, family)
+    for url, future in pending.items():
+        results[url] = future.result()
+    return [results[url] for url in urls]
+
+
+async def validate_url_async(
+    url: str,
+    *,
+    allowed_domains: Iterable[str] | None = None,
+    family: int = socket.AF_UNSPEC,
+) -> str:
+    """Async :func:`validate_url`; DNS runs on the shared resolver pool.
+
+    A cached decision is returned without leaving the event loop.
+    """
+    key = _result_key(url, allowed_domains, family)
+    hit = _result_cache.get(key)
+    if hit is not None and hit[1] > time.monotonic():
+        return validate_url(url, allowed_domains=key[1], family=family)
+    return await asyncio.get_running_loop().run_in_executor(
+        _DNS_POOL,
+        functools.partial(validate_url, url, allowed_domains=key[1], family=family),
+    )
+
+
+def _validate_or_error(
+    url: str, allowed_domains: frozenset[str] | None, family: int
+) -> str | SecurityError:
+    """Run :func:`validate_url`, returning its ``SecurityError`` instead."""
+    try:
+        return validate_url(url, allowed_domains=allowed_domains, family=family)
+    except SecurityError as exc:
+        return exc
+
+
+def _result_key(
+    url: str, allowed_domains: Iterable[str] | None, family: int
+) -> _ResultKey:
+    """Build the result-cache key, normalising *allowed_domains*."""
+    if allowed_domains is not None and not isinstance(allowed_domains, frozenset):
+        allowed_domains = _normalize_cached(tuple(allowed_domains))
+    return (url, allowed_domains, family)
+
+
+def normalize_allowed_domains(domains: Iterable[str]) -> frozenset[str]:
+    """Return *domains* lower-cased and stripped, ready for ``validate_url``.
+
+    Call this once for a stable allowlist and pass the result on every
+    request; ``validate_url`` then skips its own normalisation.
+    """
+    return frozenset(d.lower().strip() for d in domains)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_cached(domains: tuple[str, ...]) -> frozenset[str]:
+    """Memoised :func:`normalize_allowed_domains` for list/tuple callers."""
+    return normalize_allowed_domains(domains)
+
+
+def _remember_result(
+    key: _ResultKey,
+    error: tuple[str, str | None] | None,
+    now: float,
+) -> None:
+    """Store a ``validate_url`` decision, evicting the oldest if full."""
+    with _result_cache_lock:
+        if len(_result_cache) >= _RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.pop(next(iter(_result_cache)))
+        _result_cache[key] = (error, now + _RESULT_CACHE_TTL_SECONDS)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_url(url: str) -> tuple[str, str | None]:
+    """Return the scheme and hostname of *url*, memoised.
+
+    ``urlsplit`` and its ``hostname`` property are pure Python; the
+    result is an immutable tuple, so sharing it between calls is safe.
+    The scheme is interned to match the ``_ALLOWED_SCHEMES`` entries.
+    """
+    parsed = urlsplit(url)
+    return sys.intern(parsed.scheme), parsed.hostname
+
+
+def _check_url(url: str, allowed_domains: frozenset[str] | None, family: int) -> None:
+    """Uncached body of :func:`validate_url`."""
+    # ── 0. Literal-IP URLs skip urlsplit ─────────────────────────────
+    if allowed_domains is None and (match := _LITERAL_IP_URL.match(url)):
+        v4, v6 = match.groups()
+        try:
+            addr = ipaddress.IPv4Address(v4) if v4 else ipaddress.IPv6Address(v6)
+        except ValueError:
+            pass  # e.g. "1.2.3" or leading zeros — let the full path decide.
+        else:
+            _check_literal_ip(url, addr)
+            return
+
     # ── 1. Parse ─────────────────────────────────────────────────────
     try:
-        parsed = urlparse(url)
+        scheme, hostname = _parse_url(url)
     except Exception as exc:
         raise SecurityError(
             f"Malformed URL: {url}", guard_name="network_guard", value=url
         ) from exc
 
-    if parsed.scheme not in _ALLOWED_SCHEMES:
+    if scheme not in _ALLOWED_SCHEMES:
         raise SecurityError(
-            f"Blocked scheme '{parsed.scheme}'. Allowed: {sorted(_ALLOWED_SCHEMES)}",
+            f"Blocked scheme '{scheme}'. Allowed: {sorted(_ALLOWED_SCHEMES)}",
             guard_name="network_guard",
-            value=parsed.scheme,
+            value=scheme,
         )
 
-    hostname = parsed.hostname
     if not hostname:
         raise SecurityError(
             f"No hostname in URL: {url}", guard_name="network_guard", value=url
@@ -89,10 +450,9 @@ def validate_url(
 
     # ── 2. Domain allowlist (optional) ───────────────────────────────
     if allowed_domains is not None:
-        normalised = [d.lower().strip() for d in allowed_domains]
-        if hostname.lower() not in normalised:
+        if hostname.lower() not in allowed_domains:
             raise SecurityError(
-                f"Domain '{hostname}' not in allowed list: {normalised}",
+                f"Domain '{hostname}' not in allowed list: {sorted(allowed_domains)}",
                 guard_name="network_guard",
                 value=hostname,
             )
@@ -100,42 +460,25 @@ def validate_url(
     # ── 3. Check if hostname is already a raw IP ─────────────────────
     try:
         addr = ipaddress.ip_address(hostname)
-        if addr.is_private or addr.is_reserved or addr.is_loopback:
-            raise SecurityError(
-                f"Blocked private/reserved IP: {addr}",
-                guard_name="network_guard",
-                value=str(addr),
-            )
-        logger.debug("URL %s points to public IP %s — allowed", url, addr)
-        return url
     except ValueError:
         pass  # Not a raw IP — it's a hostname, resolve via DNS below.
+    else:
+        _check_literal_ip(url, addr)
+        return
 
-    # ── 4. DNS resolution ────────────────────────────────────────────
-    try:
-        infos = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC)
-    except socket.gaierror as exc:
+    # ── 4. Loopback names, rejected without a DNS round-trip ─────────
+    # RFC 6761: "localhost" and every "*.localhost" name are loopback.
+    name = hostname.rstrip(".")
+    if name == "localhost" or name.endswith(".localhost"):
         raise SecurityError(
-            f"DNS resolution failed for '{hostname}': {exc}",
-            guard_name="network_guard",
-            value=hostname,
-        ) from exc
-
-    if not infos:
-        raise SecurityError(
-            f"DNS returned no results for '{hostname}'",
+            f"Domain '{hostname}' is a loopback name — SSRF blocked",
             guard_name="network_guard",
             value=hostname,
         )
 
-    for family, _type, _proto, _canonname, sockaddr in infos:
-        ip_str = sockaddr[0]
-        try:
-            addr = ipaddress.ip_address(ip_str)
-        except ValueError:
-            continue
-
-        if addr.is_private or addr.is_reserved or addr.is_loopback:
+    # ── 5. DNS resolution (cached) ───────────────────────────────────
+    for addr in _resolve_and_classify(hostname, family):
+        if _is_blocked(addr):
             raise SecurityError(
                 f"Domain '{hostname}' resolves to private/reserved IP "
                 f"{addr} — SSRF blocked",
@@ -144,4 +487,16 @@ def validate_url(
             )
 
     logger.debug("URL %s validated — all IPs public", url)
-    return url
+
+
+def _check_literal_ip(
+    url: str, addr: ipaddress.IPv4Address | ipaddress.IPv6Address
+) -> None:
+    """Reject *addr* if it is private/reserved; no DNS is involved."""
+    if _is_blocked(addr):
+        raise SecurityError(
+            f"Blocked private/reserved IP: {addr}",
+            guard_name="network_guard",
+            value=str(addr),
+        )
+    logger.debug("URL %s points to public IP %s — allowed", url, addr)
@@ -7,12 +7,36 @@ dangerous shell commands like 'grep' or 'cat' on large files.
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from taipanstack.security.guards import guard_path_traversal
 
 logger = logging.getLogger("basalguard.tools.file_ops")
 
+# Files at least this large are searched through mmap on raw bytes.
+_MMAP_SEARCH_MIN_BYTES: int = 64 * 1024
+
+# Case-insensitive scans of a mapping lower-case this much at a time.
+_SCAN_CHUNK_BYTES: int = 1024 * 1024
+
+# The only non-ASCII characters ``re.IGNORECASE`` folds to an ASCII
+# letter, as UTF-8, keyed by that letter.  The byte scan cannot see
+# these, so files containing one are searched as text (pinned by a test
+# that checks every code point).
+_UNICODE_FOLDS: dict[str, tuple[bytes, ...]] = {
+    "i": ("\u0130".encode(), "\u0131".encode()),  # İ, dotless ı
+    "k": ("\u212a".encode(),),  # KELVIN SIGN
+    "s": ("\u017f".encode(),),  # long ſ
+}
+
+# Upper bound for a single read_file_paged call (10 MiB).
+_MAX_PAGE_BYTES: int = 10 * 1024 * 1024
+
 
 def search_in_file(
     path: str,
@@ -22,8 +46,14 @@ def search_in_file(
 ) -> list[str]:
     """Search for a text pattern in a file (grep replacement).
 
-    This function reads the file line by line to avoid loading the entire
-    file into memory, making it safe for large files.
+    Only small files are ever loaded whole, making it safe for large
+    files: files under 64 KiB are read in one call, larger ones are
+    memory-mapped, and either is scanned as raw bytes from hit to hit,
+    decoding only the matching lines.  Case-insensitive searches for
+    non-ASCII patterns (or for "i"/"k"/"s" in files containing one of
+    the non-ASCII letters ``re.IGNORECASE`` folds to them), patterns
+    containing U+FFFD, and empty or multi-line patterns fall back to
+    decoding the file line by line.
 
     Args:
         path: Relative path to the file.
@@ -50,16 +80,34 @@ def search_in_file(
 
     matches: list[str] = []
 
-    # Prepare pattern for comparison
-    search_pattern = pattern if case_sensitive else pattern.lower()
-
     try:
+        # Bytes-level matching is exact for any case-sensitive pattern and
+        # for ASCII ones (bytes.lower folds ASCII letters only).  U+FFFD
+        # can stand for invalid bytes in the decoded text, so it is only
+        # matched there.
+        if (
+            (case_sensitive or pattern.isascii())
+            and pattern
+            and "\n" not in pattern
+            and "\r" not in pattern
+            and "\ufffd" not in pattern
+        ):
+            if resolved_path.stat().st_size < _MMAP_SEARCH_MIN_BYTES:
+                found = _search_small(resolved_path, pattern, case_sensitive)
+            else:
+                found = _search_mapped(resolved_path, pattern, case_sensitive)
+            if found is not None:
+                return found
+
+        # Literal match via one compiled regex: case-insensitive lines are
+        # matched in place instead of being lower-cased copies.
+        search = re.compile(
+            re.escape(pattern), 0 if case_sensitive else re.IGNORECASE
+        ).search
+
         with resolved_path.open("r", encoding="utf-8", errors="replace") as f:
             for line in f:
-                # Prepare line for comparison
-                line_to_check = line if case_sensitive else line.lower()
-
-                if search_pattern in line_to_check:
+                if search(line):
                     matches.append(line.rstrip("\n"))
 
     except OSError as exc:
@@ -69,6 +117,121 @@ def search_in_file(
     return matches
 
 
+def _search_small(path: Path, pattern: str, case_sensitive: bool) -> list[str] | None:
+    """Byte-level ``search_in_file`` for files under the mmap threshold.
+
+    The file is read in one call and scanned like a mapping, so there is
+    no per-line Python work for lines without a hit.  Returns ``None``
+    if the text path is needed (see :func:`_needs_unicode_fold`).
+    """
+    data = path.read_bytes()
+    if _needs_unicode_fold(data, pattern, case_sensitive):
+        return None
+    return _scan_lines(data, pattern, case_sensitive)
+
+
+def _search_mapped(path: Path, pattern: str, case_sensitive: bool) -> list[str] | None:
+    """Byte-level ``search_in_file`` for large files, via a read-only mapping."""
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        if _needs_unicode_fold(mm, pattern, case_sensitive):
+            return None
+        return _scan_lines(mm, pattern, case_sensitive)
+
+
+def _needs_unicode_fold(
+    buf: bytes | mmap.mmap, pattern: str, case_sensitive: bool
+) -> bool:
+    """Whether a case-insensitive ASCII *pattern* could match non-ASCII text.
+
+    The text path's ``re.IGNORECASE`` matches "k" against KELVIN SIGN,
+    "i" against İ/ı and "s" against ſ; ``bytes.lower`` folds none of
+    them.  If *buf* holds one relevant to *pattern*, search it as text
+    so both paths fold the same way.
+    """
+    if case_sensitive:
+        return False
+    letters = set(pattern.lower())
+    return any(
+        buf.find(seq) != -1
+        for letter, seqs in _UNICODE_FOLDS.items()
+        if letter in letters
+        for seq in seqs
+    )
+
+
+def _scan_lines(
+    buf: bytes | mmap.mmap, pattern: str, case_sensitive: bool
+) -> list[str]:
+    """Return the decoded lines of *buf* that contain *pattern*.
+
+    Case-insensitive searches lower-case the haystack with
+    ``bytes.lower`` (one native pass) and look for the lower-cased
+    needle with a plain literal regex, which is far faster than an
+    ``IGNORECASE`` scan.  A mapping is lowered one ~1 MiB run of whole
+    lines at a time, so memory stays bounded.  Callers guarantee a
+    non-empty pattern without line breaks, and ASCII-only when
+    case-insensitive (``bytes.lower`` folds ASCII letters only).
+    """
+    needle = pattern.encode("utf-8")
+    if case_sensitive:
+        return _scan(buf, buf, re.compile(re.escape(needle)).search)
+
+    search = re.compile(re.escape(needle.lower())).search
+    if isinstance(buf, bytes):
+        return _scan(buf, buf.lower(), search)
+
+    matches: list[str] = []
+    size = len(buf)
+    start = 0
+    while start < size:
+        end = buf.find(b"\n", start + _SCAN_CHUNK_BYTES)
+        end = size if end == -1 else end + 1
+        chunk = buf[start:end]
+        matches += _scan(chunk, chunk.lower(), search)
+        start = end
+    return matches
+
+
+def _scan(
+    buf: bytes | mmap.mmap,
+    haystack: bytes | mmap.mmap,
+    search: Callable[[Any, int], re.Match[bytes] | None],
+) -> list[str]:
+    """Jump between hits of *search* in *haystack*, decoding hit lines.
+
+    *haystack* is *buf* itself or a same-length lower-cased copy; hits
+    are found in it and the matching lines are sliced from *buf*.
+    """
+    matches: list[str] = []
+    pos = 0
+    while (found := search(haystack, pos)) is not None:
+        hit, hit_end = found.span()
+        start = haystack.rfind(b"\n", 0, hit) + 1
+        end = haystack.find(b"\n", hit_end)
+        if end == -1:
+            end = len(haystack)
+        line = buf[start:end]
+        if b"\r" in line:
+            # Text mode also ends a line at a lone "\r" (and drops the
+            # "\r" of "\r\n"), so split the same way before decoding.
+            matches.extend(
+                part.decode("utf-8", errors="replace")
+                for part, folded in zip(
+                    line.split(b"\r"),
+                    haystack[start:end].split(b"\r"),
+                    strict=True,
+                )
+                if search(folded, 0)
+            )
+        else:
+            matches.append(line.decode("utf-8", errors="replace"))
+        pos = end + 1
+    return matches
+
+
 def read_file_paged(
     path: str,
     offset: int = 0,
@@ -82,7 +245,7 @@ def read_file_paged(
     Args:
         path: Relative path to the file.
         offset: The byte offset to start reading from.
-        limit: The maximum number of characters (or bytes approx) to read.
+        limit: The maximum number of bytes to read, capped at 10 MiB.
         base_dir: The base directory (workspace root) to restrict access to.
 
     Returns:
@@ -102,16 +265,23 @@ def read_file_paged(
 
     if offset < 0:
         offset = 0
-    if limit < 0:
-        limit = 0
+    limit = min(max(limit, 0), _MAX_PAGE_BYTES)
 
     try:
-        # Open in binary mode to allow safe seeking to arbitrary byte offsets
-        with resolved_path.open("rb") as f:
-            f.seek(offset)
-            content_bytes = f.read(limit)
-            # Decode with replacement to handle potential cut multibyte chars
-            return content_bytes.decode("utf-8", errors="replace")
+        if hasattr(os, "pread"):
+            # One positioned read of exactly the requested range, without
+            # a buffered file object over-reading into its own buffer.
+            fd = os.open(resolved_path, os.O_RDONLY)
+            try:
+                content_bytes = os.pread(fd, limit, offset)
+            finally:
+                os.close(fd)
+        else:  # Windows: no pread; seek and read in binary mode.
+            with resolved_path.open("rb") as f:
+                f.seek(offset)
+                content_bytes = f.read(limit)
+        # Decode with replacement to handle potential cut multibyte chars
+        return content_bytes.decode("utf-8", errors="replace")
     except OSError as exc:
         logger.error("Error reading file paged %s: %s", resolved_path, exc)
         raise
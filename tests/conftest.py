@@ -0,0 +1,78 @@
+"""Shared pytest fixtures for the BasalGuard test suite."""
+
+from __future__ import annotations
+
+import socket
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from basalguard.core.agent_firewall import BasalGuardCore
+from basalguard.llm_interface import tool_schemas
+from basalguard.security import network
+
+# Hostnames the fake resolver knows, all mapped to public addresses.
+FAKE_DNS: dict[str, str] = {
+    "www.example.com": "93.184.216.34",
+    "www.google.com": "142.250.80.36",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_validators(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Pay one-off compile/first-call costs once, before any test.
+
+    The tool-schema validators compile lazily (a few ms); without this
+    that cost lands on whichever test happens to run first, which skews
+    ``--durations`` reports.
+    """
+    fw = BasalGuardCore(tmp_path_factory.mktemp("bg_warmup"))
+    fw.safe_write_file("warm.txt", "x")
+    fw.safe_execute_command(["not-allowlisted"])
+    network.validate_url("https://1.1.1.1/")
+    # Builds every validator; fastjsonschema is a declared dependency.
+    assert tool_schemas.BASALGUARD_VALIDATORS
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    """Return a fresh temporary workspace directory."""
+    ws = tmp_path / "ai_workspace"
+    return ws  # BasalGuardCore.__init__ will create it
+
+
+@pytest.fixture
+def firewall(workspace: Path) -> BasalGuardCore:
+    """Return a BasalGuardCore instance with a temp workspace."""
+    return BasalGuardCore(workspace)
+
+
+@pytest.fixture(scope="session")
+def firewall_readonly(tmp_path_factory: pytest.TempPathFactory) -> BasalGuardCore:
+    """Return one BasalGuardCore shared by the whole session.
+
+    Only for tests whose calls are rejected or otherwise leave the
+    workspace and the firewall's caches untouched.
+    """
+    return BasalGuardCore(tmp_path_factory.mktemp("bg_readonly"))
+
+
+@pytest.fixture
+def fake_dns(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Answer DNS lookups from ``FAKE_DNS``; any other name fails.
+
+    Cached validation decisions and DNS answers are dropped first, so
+    the fake resolver is what the test actually sees.
+    """
+
+    def getaddrinfo(host: str, *args: Any, **kwargs: Any) -> list[Any]:
+        try:
+            ip = FAKE_DNS[host]
+        except KeyError:
+            raise socket.gaierror(socket.EAI_NONAME, "not in FAKE_DNS") from None
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0))]
+
+    network.clear_validation_cache()
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    return FAKE_DNS
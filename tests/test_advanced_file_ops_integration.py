@@ -1,18 +1,12 @@
-import pytest
+import re
+import string
+import sys
 from pathlib import Path
-from basalguard.core.agent_firewall import BasalGuardCore
-
-
-@pytest.fixture
-def workspace(tmp_path: Path) -> Path:
-    ws = tmp_path / "workspace"
-    ws.mkdir()
-    return ws
 
+import pytest
 
-@pytest.fixture
-def firewall(workspace: Path) -> BasalGuardCore:
-    return BasalGuardCore(workspace)
+from basalguard.core.agent_firewall import BasalGuardCore
+from basalguard.tools import advanced_file_ops
 
 
 def test_file_ops_integration(firewall: BasalGuardCore, workspace: Path) -> None:
@@ -51,18 +45,106 @@ def test_file_ops_integration(firewall: BasalGuardCore, workspace: Path) -> None
     assert len(result["content"]) == len(test_file.read_text())
 
 
-def test_search_in_file_blocked(firewall: BasalGuardCore) -> None:
-    # Test path traversal
+def test_search_in_file_is_literal(firewall: BasalGuardCore, workspace: Path) -> None:
+    (workspace / "log.txt").write_text("ERROR a.c\nerror abc\nok\n", encoding="utf-8")
+
+    result = firewall.validate_intent(
+        "search_in_file", {"path": "log.txt", "pattern": "error A.C"}
+    )
+    assert result["matches"] == ["ERROR a.c"]
+
     result = firewall.validate_intent(
+        "search_in_file",
+        {"path": "log.txt", "pattern": "error", "case_sensitive": True},
+    )
+    assert result["matches"] == ["error abc"]
+
+
+def test_search_folds_like_text(firewall: BasalGuardCore, workspace: Path) -> None:
+    # KELVIN SIGN and dotted capital I lower-case to ASCII "k" / "i".
+    (workspace / "units.txt").write_text(
+        "300 \u212a\n\u0130zmir\nnone\n", encoding="utf-8"
+    )
+    for pattern, line in [("k", "300 \u212a"), ("I", "\u0130zmir")]:
+        result = firewall.validate_intent(
+            "search_in_file", {"path": "units.txt", "pattern": pattern}
+        )
+        assert result["matches"] == [line]
+
+
+@pytest.mark.parametrize("extra", ["", "300 \u212a\n"], ids=["plain", "with_kelvin"])
+@pytest.mark.parametrize("filler", [0, 80 * 1024], ids=["small", "mapped"])
+def test_search_folding_ignores_unrelated_text(
+    firewall: BasalGuardCore, workspace: Path, extra: str, filler: int
+) -> None:
+    # Dotless ı and long ſ fold to "i" / "s" whatever else the file holds.
+    (workspace / "a.txt").write_text(
+        "th\u0131s line\n\u017fun\n" + "." * filler + "\n" + extra,
+        encoding="utf-8",
+    )
+    for pattern, line in [("this", "th\u0131s line"), ("sun", "\u017fun")]:
+        result = firewall.validate_intent(
+            "search_in_file", {"path": "a.txt", "pattern": pattern}
+        )
+        assert result["matches"] == [line]
+
+
+def test_unicode_fold_table_is_complete() -> None:
+    # Every non-ASCII character IGNORECASE folds to an ASCII letter.
+    text = "".join(
+        chr(cp) for cp in range(0x80, sys.maxunicode + 1) if not 0xD800 <= cp < 0xE000
+    )
+    folded = {
+        ch.encode(): next(
+            a for a in string.ascii_lowercase if re.fullmatch(a, ch, re.IGNORECASE)
+        )
+        for ch in re.findall("[a-z]", text, re.IGNORECASE)
+    }
+    table = {
+        seq: letter
+        for letter, seqs in advanced_file_ops._UNICODE_FOLDS.items()
+        for seq in seqs
+    }
+    assert folded == table
+
+
+def test_search_matches_replacement_char(
+    firewall: BasalGuardCore, workspace: Path
+) -> None:
+    # Invalid UTF-8 decodes to U+FFFD, which the pattern may contain.
+    (workspace / "bin.txt").write_bytes(b"ok\nbad \xff byte\n")
+    result = firewall.validate_intent(
+        "search_in_file",
+        {"path": "bin.txt", "pattern": "\ufffd byte", "case_sensitive": True},
+    )
+    assert result["matches"] == ["bad \ufffd byte"]
+
+
+def test_search_in_large_file(firewall: BasalGuardCore, workspace: Path) -> None:
+    # Above the mmap threshold; CRLF endings must be stripped as in text mode.
+    filler = "INFO nothing to see here\r\n" * 4000
+    (workspace / "big.log").write_bytes(
+        (filler + "ERROR disk full\r\n" + filler + "error: retry\r\n").encode()
+    )
+
+    result = firewall.validate_intent(
+        "search_in_file", {"path": "big.log", "pattern": "error"}
+    )
+    assert result["matches"] == ["ERROR disk full", "error: retry"]
+
+
+def test_search_in_file_blocked(firewall_readonly: BasalGuardCore) -> None:
+    # Test path traversal
+    result = firewall_readonly.validate_intent(
         "search_in_file", {"path": "../../etc/passwd", "pattern": "root"}
     )
     assert result["status"] == "blocked"
     assert "path_traversal" in str(result.get("reason", ""))
 
 
-def test_read_file_paged_blocked(firewall: BasalGuardCore) -> None:
+def test_read_file_paged_blocked(firewall_readonly: BasalGuardCore) -> None:
     # Test path traversal
-    result = firewall.validate_intent(
+    result = firewall_readonly.validate_intent(
         "read_file_paged", {"path": "../../etc/passwd", "offset": 0}
     )
     assert result["status"] == "blocked"
@@ -4,6 +4,7 @@ Covers:
     - Workspace creation
     - Path-traversal blocking
     - Normal file writes
+    - File reads (missing paths, directories, newlines)
     - Command-injection blocking
     - Allowlist enforcement
     - validate_intent routing & error handling
@@ -12,29 +13,18 @@ Covers:
 
 from __future__ import annotations
 
+import stat
 import sys
 from pathlib import Path
 
 import pytest
 
+from basalguard.core import agent_firewall
 from basalguard.core.agent_firewall import (
     BasalGuardCore,
 )
 
 
-@pytest.fixture
-def workspace(tmp_path: Path) -> Path:
-    """Return a fresh temporary workspace directory."""
-    ws = tmp_path / "ai_workspace"
-    return ws  # BasalGuardCore.__init__ will create it
-
-
-@pytest.fixture
-def firewall(workspace: Path) -> BasalGuardCore:
-    """Return a BasalGuardCore instance with a temp workspace."""
-    return BasalGuardCore(workspace)
-
-
 # ── Workspace Creation ───────────────────────────────────────────────
 
 
@@ -58,13 +48,20 @@ class TestWorkspaceCreation:
         """Custom command allowlist overrides the default."""
         custom = frozenset({"cat"})
         fw = BasalGuardCore(workspace, command_allowlist=custom)
-        assert fw.command_allowlist == custom
+        assert fw.command_allowlist is custom  # immutable, so not copied
+
+    def test_mutable_allowlist_is_frozen(self, workspace: Path) -> None:
+        """Mutating the caller's set after init does not widen the policy."""
+        custom = {"cat"}
+        fw = BasalGuardCore(workspace, command_allowlist=custom)
+        custom.add("curl")
+        assert fw.command_allowlist == frozenset({"cat"})
 
-    def test_repr(self, firewall: BasalGuardCore) -> None:
+    def test_repr(self, firewall_readonly: BasalGuardCore) -> None:
         """__repr__ includes workspace path and allowlist size."""
-        r = repr(firewall)
+        r = repr(firewall_readonly)
         assert "BasalGuardCore" in r
-        assert repr(firewall.workspace_root) in r
+        assert repr(firewall_readonly.workspace_root) in r
 
 
 # ── safe_write_file ──────────────────────────────────────────────────
@@ -80,34 +77,57 @@ class TestSafeWriteFile:
         assert result["action"] == "write_file"
         assert result["bytes_written"] == len("Hello, World!".encode("utf-8"))
 
-        written = Path(result["path"])
-        assert written.exists()
-        assert written.read_text(encoding="utf-8") == "Hello, World!"
+        assert Path(result["path"]).is_file()
 
     def test_write_nested_path(self, firewall: BasalGuardCore) -> None:
         """Writing to a sub-directory creates parents automatically."""
         result = firewall.safe_write_file("sub/dir/notes.md", "# Notes")
         assert result["status"] == "success"
-        assert Path(result["path"]).read_text(encoding="utf-8") == "# Notes"
-
-    def test_blocks_path_traversal_dotdot(self, firewall: BasalGuardCore) -> None:
-        """Path with '..' is blocked."""
-        result = firewall.safe_write_file("../../etc/passwd", "pwned")
+        assert result["bytes_written"] == len(b"# Notes")
+        assert Path(result["path"]).is_file()
+
+    @pytest.mark.parametrize(
+        ("path", "reason"),
+        [
+            ("../../etc/passwd", "Path traversal pattern detected: .."),
+            ("%2e%2e/secret.key", "Path traversal pattern detected: %2e%2e"),
+            ("~/evil.sh", "Path traversal pattern detected: ~"),
+            ("ok.txt\x00.sh", "Null byte in path"),
+            ("", "Empty path"),
+        ],
+        ids=["dotdot", "encoded_dotdot", "tilde", "null_byte", "empty"],
+    )
+    def test_blocks_bad_paths(
+        self, firewall_readonly: BasalGuardCore, path: str, reason: str
+    ) -> None:
+        """Traversal, null bytes and empty paths never reach the disk."""
+        result = firewall_readonly.safe_write_file(path, "pwned")
         assert result["status"] == "blocked"
-        assert (
-            "path_traversal" in result["reason"].lower()
-            or "traversal" in result["reason"].lower()
-        )
-
-    def test_blocks_path_traversal_encoded(self, firewall: BasalGuardCore) -> None:
-        """URL-encoded '..' is also caught."""
-        result = firewall.safe_write_file("%2e%2e/secret.key", "pwned")
+        assert result["reason"] == f"[path_traversal] {reason}"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    @pytest.mark.parametrize("mode", [0o600, 0o755])
+    def test_rewrite_keeps_file_mode(self, firewall: BasalGuardCore, mode: int) -> None:
+        """Overwriting a file keeps its permissions; new files honour umask."""
+        target = Path(firewall.safe_write_file("script.sh", "v1")["path"])
+        assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~agent_firewall._UMASK
+        target.chmod(mode)
+        assert firewall.safe_write_file("script.sh", "v2")["status"] == "success"
+        assert stat.S_IMODE(target.stat().st_mode) == mode
+
+    def test_failed_write_leaves_no_temp_file(self, firewall: BasalGuardCore) -> None:
+        """A write that cannot land cleans up its temp file."""
+        (firewall.workspace_root / "taken").mkdir()
+        result = firewall.safe_write_file("taken", "x")
         assert result["status"] == "blocked"
+        assert [p.name for p in firewall.workspace_root.iterdir()] == ["taken"]
 
-    def test_blocks_tilde_expansion(self, firewall: BasalGuardCore) -> None:
-        """Tilde (~) path is treated as traversal attempt."""
-        result = firewall.safe_write_file("~/evil.sh", "rm -rf /")
-        assert result["status"] == "blocked"
+    def test_dots_inside_a_name_are_not_traversal(
+        self, firewall: BasalGuardCore
+    ) -> None:
+        """Only whole '..' segments count as traversal."""
+        result = firewall.safe_write_file("notes..md", "ok")
+        assert result["status"] == "success"
 
     def test_sanitises_dangerous_filename(self, firewall: BasalGuardCore) -> None:
         """Dangerous characters in filename are sanitised, not rejected."""
@@ -120,8 +140,56 @@ class TestSafeWriteFile:
         assert ">" not in written_name
 
 
+# ── safe_read_file ───────────────────────────────────────────────────
+
+
+class TestSafeReadFile:
+    """Tests for the safe_read_file method."""
+
+    def test_read_back_written_file(self, firewall: BasalGuardCore) -> None:
+        firewall.safe_write_file("note.txt", "olá\r\nmundo")
+        result = firewall.safe_read_file("note.txt")
+        assert result["status"] == "success"
+        assert result["content"] == "olá\nmundo"
+        assert result["size_bytes"] == len("olá\r\nmundo".encode("utf-8"))
+
+    def test_binary_file_is_reported(self, firewall: BasalGuardCore) -> None:
+        (firewall.workspace_root / "blob.bin").write_bytes(b"ok\xff\xfe")
+        result = firewall.safe_read_file("blob.bin")
+        assert result["status"] == "error"
+        assert "UTF-8" in result["reason"]
+
+    def test_missing_file(self, firewall: BasalGuardCore) -> None:
+        result = firewall.safe_read_file("nope.txt")
+        assert result["status"] == "error"
+        assert "not found" in result["reason"]
+
+    def test_directory_is_not_a_file(self, firewall: BasalGuardCore) -> None:
+        (firewall.workspace_root / "sub").mkdir()
+        result = firewall.safe_read_file("sub")
+        assert result["status"] == "error"
+        assert "not a file" in result["reason"]
+
+
 # ── safe_execute_command ─────────────────────────────────────────────
 
+# One argument per bash metacharacter category.  With shell=False none
+# of them may be interpreted: the child must see the exact string.
+INJECTION_CASES: list[tuple[str, str]] = [
+    ("sequence", "hello; world"),
+    ("pipe", "hi | cat /etc/shadow"),
+    ("backtick", "`whoami`"),
+    ("substitution", "$(id)"),
+    ("line_break", "\nwhoami"),
+    ("logical_and", "&& rm -rf /"),
+    ("logical_or", "|| id"),
+    ("redirection", "> /etc/passwd"),
+    ("glob", "*"),
+    ("brace", "{a,b}"),
+    ("quotes", "'q' \"q\""),
+]
+_CASE_IDS = [category for category, _ in INJECTION_CASES]
+
 
 class TestSafeExecuteCommand:
     """Tests for the safe_execute_command method."""
@@ -133,41 +201,42 @@ class TestSafeExecuteCommand:
         assert result["status"] == "success"
         assert result["returncode"] == 0
 
-    def test_blocks_disallowed_command(self, firewall: BasalGuardCore) -> None:
+    def test_blocks_disallowed_command(self, firewall_readonly: BasalGuardCore) -> None:
         """A command not in the allowlist is blocked."""
-        result = firewall.safe_execute_command(["curl", "http://evil.com"])
+        result = firewall_readonly.safe_execute_command(["curl", "http://evil.com"])
         assert result["status"] == "blocked"
         assert "curl" in result["violator"]
 
-    def test_allows_safe_punctuation_semicolon(self, firewall: BasalGuardCore) -> None:
-        """Shell metacharacter (;) is treated as literal arg (shell=False)."""
-        # Use python to prove it's treated literally.
-        cmd = [sys.executable, "-c", "import sys; print(sys.argv[1])", "hello; world"]
+    @pytest.mark.parametrize(("category", "arg"), INJECTION_CASES, ids=_CASE_IDS)
+    def test_shell_metacharacters_are_literal(
+        self, firewall: BasalGuardCore, category: str, arg: str
+    ) -> None:
+        """Shell metacharacters reach argv untouched (shell=False)."""
+        # ascii() keeps the check independent of the platform's newlines.
+        cmd = [sys.executable, "-c", "import sys; print(ascii(sys.argv[1]))", arg]
         result = firewall.safe_execute_command(cmd)
         assert result["status"] == "success"
-        assert "hello; world" in result["stdout"]
+        assert result["stdout"].strip() == ascii(arg)
 
-    def test_allows_safe_punctuation_pipe(self, firewall: BasalGuardCore) -> None:
-        """Pipe (|) is treated as literal arg (shell=False)."""
-        cmd = [sys.executable, "-c", "import sys; print(sys.argv[1])", "hi | cat"]
-        result = firewall.safe_execute_command(cmd)
-        assert result["status"] == "success"
-        assert "hi | cat" in result["stdout"]
-
-    def test_allows_safe_punctuation_backtick(self, firewall: BasalGuardCore) -> None:
-        """Backticks are treated as literal args (shell=False)."""
-        cmd = [sys.executable, "-c", "import sys; print(sys.argv[1])", "`whoami`"]
-        result = firewall.safe_execute_command(cmd)
-        assert result["status"] == "success"
-        # Verify it did NOT execute whoami (which would output the username)
-        # It should output literal backticks
-        assert "`whoami`" in result["stdout"]
+    def test_blocks_null_byte_argument(self, firewall_readonly: BasalGuardCore) -> None:
+        """Injection checks still apply without the firewall's own guard call."""
+        result = firewall_readonly.safe_execute_command(["echo", "hi\x00rm -rf /"])
+        assert result["status"] == "blocked"
+        assert "[command_injection]" in result["reason"]
 
-    def test_blocks_empty_command(self, firewall: BasalGuardCore) -> None:
+    def test_blocks_empty_command(self, firewall_readonly: BasalGuardCore) -> None:
         """An empty command list is blocked."""
-        result = firewall.safe_execute_command([])
+        result = firewall_readonly.safe_execute_command([])
         assert result["status"] == "blocked"
 
+    def test_command_clears_path_cache(self, firewall: BasalGuardCore) -> None:
+        """Resolved paths and known dirs are forgotten once a command has run."""
+        firewall.safe_write_file("cached.txt", "x")
+        assert firewall._path_cache
+        firewall.safe_execute_command(["ls"])
+        assert not firewall._path_cache
+        assert not firewall._known_dirs
+
     def test_echo_command(self, firewall: BasalGuardCore) -> None:
         """echo is in the default allowlist and works."""
         # Using python as echo replacement for cross-platform compatibility
@@ -185,67 +254,75 @@ class TestSafeExecuteCommand:
 # ── validate_intent ──────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="class")
+def intent_firewall(tmp_path_factory: pytest.TempPathFactory) -> BasalGuardCore:
+    """One firewall per class; the dispatch tests write distinct files."""
+    return BasalGuardCore(tmp_path_factory.mktemp("bg_intent"))
+
+
 class TestValidateIntent:
     """Tests for the validate_intent dispatcher."""
 
-    def test_routes_write_file(self, firewall: BasalGuardCore) -> None:
+    def test_routes_write_file(self, intent_firewall: BasalGuardCore) -> None:
         """'write_file' action is dispatched to safe_write_file."""
-        result = firewall.validate_intent(
+        result = intent_firewall.validate_intent(
             "write_file",
             {"path": "intent_test.txt", "content": "routed!"},
         )
         assert result["status"] == "success"
         assert result["action"] == "write_file"
 
-    def test_routes_execute_command(self, firewall: BasalGuardCore) -> None:
+    def test_routes_execute_command(self, intent_firewall: BasalGuardCore) -> None:
         """'execute_command' action is dispatched to safe_execute_command."""
         cmd = [sys.executable, "-c", "import sys; print(sys.argv[1])", "dispatched"]
-        result = firewall.validate_intent(
+        result = intent_firewall.validate_intent(
             "execute_command",
             {"command_parts": cmd},
         )
         assert result["status"] == "success"
         assert "dispatched" in result["stdout"]
 
-    def test_unknown_action(self, firewall: BasalGuardCore) -> None:
+    def test_unknown_action(self, intent_firewall: BasalGuardCore) -> None:
         """An unknown action returns an error dict."""
-        result = firewall.validate_intent("hack_the_planet", {})
+        result = intent_firewall.validate_intent("hack_the_planet", {})
         assert result["status"] == "error"
         assert "Unknown action" in result["reason"]
 
-    def test_missing_path_param(self, firewall: BasalGuardCore) -> None:
+    def test_missing_path_param(self, intent_firewall: BasalGuardCore) -> None:
         """'write_file' without 'path' returns an error."""
-        result = firewall.validate_intent("write_file", {"content": "no path"})
+        result = intent_firewall.validate_intent("write_file", {"content": "no path"})
         assert result["status"] == "error"
         assert "path" in result["reason"].lower()
 
-    def test_missing_content_param(self, firewall: BasalGuardCore) -> None:
+    def test_missing_content_param(self, intent_firewall: BasalGuardCore) -> None:
         """'write_file' without 'content' returns an error."""
-        result = firewall.validate_intent("write_file", {"path": "test.txt"})
+        result = intent_firewall.validate_intent("write_file", {"path": "test.txt"})
         assert result["status"] == "error"
 
-    def test_missing_command_parts(self, firewall: BasalGuardCore) -> None:
+    def test_missing_command_parts(self, intent_firewall: BasalGuardCore) -> None:
         """'execute_command' without 'command_parts' returns an error."""
-        result = firewall.validate_intent("execute_command", {})
+        result = intent_firewall.validate_intent("execute_command", {})
         assert result["status"] == "error"
 
-    def test_empty_command_parts(self, firewall: BasalGuardCore) -> None:
+    def test_empty_command_parts(self, intent_firewall: BasalGuardCore) -> None:
         """'execute_command' with empty list returns an error."""
-        result = firewall.validate_intent("execute_command", {"command_parts": []})
+        result = intent_firewall.validate_intent(
+            "execute_command", {"command_parts": []}
+        )
         assert result["status"] == "error"
 
-    def test_traversal_via_intent(self, firewall: BasalGuardCore) -> None:
+    def test_traversal_via_intent(self, intent_firewall: BasalGuardCore) -> None:
         """Path traversal via validate_intent is still blocked."""
-        result = firewall.validate_intent(
+        result = intent_firewall.validate_intent(
             "write_file",
             {"path": "../../../secret.key", "content": "evil"},
         )
         assert result["status"] == "blocked"
 
-    def test_injection_via_intent_safe(self, firewall: BasalGuardCore) -> None:
+    def test_injection_via_intent_safe(self, intent_firewall: BasalGuardCore) -> None:
         """Command injection attempts are treated as literals via validate_intent."""
         cmd = [sys.executable, "-c", "import sys; print(sys.argv[1])", "&& rm -rf /"]
-        result = firewall.validate_intent(
+        result = intent_firewall.validate_intent(
             "execute_command",
             {"command_parts": cmd},
         )
@@ -265,18 +342,13 @@ class TestValidateProjectName:
         assert result["status"] == "success"
         assert result["validated_name"] == "my_cool_project"
 
-    def test_invalid_name_starts_with_number(self) -> None:
-        """A name starting with a digit is rejected."""
-        result = BasalGuardCore.validate_project_name("123project")
-        assert result["status"] == "blocked"
-        assert "violator" in result
-
-    def test_empty_name(self) -> None:
-        """An empty name is rejected."""
-        result = BasalGuardCore.validate_project_name("")
-        assert result["status"] == "blocked"
-
-    def test_reserved_name(self) -> None:
-        """A reserved name like 'test' is rejected."""
-        result = BasalGuardCore.validate_project_name("test")
+    @pytest.mark.parametrize(
+        "name",
+        ["123project", "", "test"],
+        ids=["starts_with_number", "empty", "reserved"],
+    )
+    def test_invalid_name(self, name: str) -> None:
+        """Bad names are rejected and reported as the violator."""
+        result = BasalGuardCore.validate_project_name(name)
         assert result["status"] == "blocked"
+        assert result["violator"] == name
@@ -0,0 +1,195 @@
+"""Unit tests for the ToolExecutor (LLM tool-call dispatcher).
+
+Covers:
+    - Tool-name → action routing
+    - Unknown tools
+    - Argument validation against the tool schemas
+    - Batched execution into role=tool messages
+    - Batched async execution (order, concurrent web requests, local
+      calls off the event loop)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from basalguard.core.agent_firewall import BasalGuardCore
+from basalguard.llm_interface.executor import ToolExecutor
+from basalguard.llm_interface import tool_schemas
+from basalguard.llm_interface.tool_schemas import validate_tool_args
+from taipanstack.security.guards import SecurityError
+
+
+@pytest.fixture
+def executor(tmp_path: Path) -> ToolExecutor:
+    """Return a ToolExecutor wrapping a temp-workspace firewall."""
+    return ToolExecutor(BasalGuardCore(tmp_path / "ws"))
+
+
+class TestExecuteToolCall:
+    """Tests for execute_tool_call."""
+
+    def test_routes_write_file(self, executor: ToolExecutor) -> None:
+        """A valid write_file call reaches the firewall."""
+        output = executor.execute_tool_call(
+            "write_file", {"path": "a.txt", "content": "hi"}
+        )
+        assert json.loads(output)["status"] == "success"
+
+    def test_unknown_tool(self, executor: ToolExecutor) -> None:
+        """An unknown tool name returns an error."""
+        result = json.loads(executor.execute_tool_call("rm_rf", {}))
+        assert result["status"] == "error"
+        assert "Unknown tool" in result["reason"]
+
+    def test_rejects_arguments_outside_schema(self, executor: ToolExecutor) -> None:
+        """Arguments that violate the tool schema are rejected."""
+        result = json.loads(
+            executor.execute_tool_call("read_file_paged", {"path": "a.txt", "x": 1})
+        )
+        assert result["status"] == "error"
+        assert "Invalid arguments" in result["reason"]
+
+
+class TestValidateToolArgs:
+    """Tests for the precompiled tool-argument validators."""
+
+    def test_valid_arguments_pass(self) -> None:
+        validate_tool_args("write_file", {"path": "a.txt", "content": "hi"})
+
+    def test_invalid_arguments_raise_security_error(self) -> None:
+        with pytest.raises(SecurityError) as excinfo:
+            validate_tool_args("run_command", {"command_parts": "ls -la"})
+        assert excinfo.value.guard_name == "tool_schema"
+
+    def test_known_tool_rejected_without_fastjsonschema(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing fastjsonschema fails closed instead of skipping checks."""
+        monkeypatch.setattr(tool_schemas, "HAS_FASTJSONSCHEMA", False)
+        monkeypatch.setattr(tool_schemas, "_validators", {})
+        with pytest.raises(SecurityError, match="unavailable"):
+            validate_tool_args("write_file", {"path": "a.txt", "content": "hi"})
+        validate_tool_args("rm_rf", {})  # unknown names are the caller's job
+
+
+class TestToolsJson:
+    """Tests for the pre-serialised tool payload."""
+
+    def test_serialised_once_and_round_trips(self) -> None:
+        payload = tool_schemas.BASALGUARD_TOOLS_JSON
+        assert tool_schemas.BASALGUARD_TOOLS_JSON is payload
+        assert json.loads(payload) == list(tool_schemas.BASALGUARD_TOOLS)
+
+
+def _call(call_id: str, name: str, arguments: dict[str, object]) -> dict[str, object]:
+    return {
+        "id": call_id,
+        "function": {"name": name, "arguments": json.dumps(arguments)},
+    }
+
+
+class TestExecuteToolCalls:
+    """Tests for execute_tool_calls."""
+
+    def test_returns_tool_messages_in_order(self, executor: ToolExecutor) -> None:
+        """Each call becomes one role=tool message, in input order."""
+        results = executor.execute_tool_calls(
+            [
+                _call("c1", "write_file", {"path": "a.txt", "content": "hi"}),
+                _call("c2", "read_file", {"path": "a.txt"}),
+            ]
+        )
+        assert [(r["role"], r["tool_call_id"]) for r in results] == [
+            ("tool", "c1"),
+            ("tool", "c2"),
+        ]
+        assert json.loads(results[1]["content"])["content"] == "hi"
+
+
+class TestExecuteToolCallsAsync:
+    """Tests for execute_tool_calls_async."""
+
+    def test_preserves_call_order(self, executor: ToolExecutor) -> None:
+        """Results line up with the input calls, web or local."""
+        calls = [
+            _call("c1", "web_request", {"url": "http://10.0.0.1/"}),
+            _call("c2", "write_file", {"path": "a.txt", "content": "hi"}),
+            _call("c3", "read_file", {"path": "a.txt"}),
+        ]
+        results = asyncio.run(executor.execute_tool_calls_async(calls))
+        assert [r["tool_call_id"] for r in results] == ["c1", "c2", "c3"]
+        statuses = [json.loads(r["content"])["status"] for r in results]
+        assert statuses == ["blocked", "success", "success"]
+
+    def test_web_requests_run_concurrently(self, executor: ToolExecutor) -> None:
+        """All web requests are in flight at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200, text="ok")
+
+        async def run() -> list[dict[str, str]]:
+            executor.firewall._async_http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await executor.execute_tool_calls_async(
+                    [
+                        _call(f"c{i}", "web_request", {"url": "http://93.184.216.34/"})
+                        for i in range(3)
+                    ]
+                )
+            finally:
+                await executor.firewall.aclose()
+
+        results = asyncio.run(run())
+        assert all(json.loads(r["content"])["status"] == "success" for r in results)
+        assert peak == 3
+
+    def test_local_calls_overlap_web_requests(
+        self, executor: ToolExecutor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A slow local call does not hold up the event loop."""
+        web_started = threading.Event()
+        execute = executor.execute_tool_call
+
+        def slow_execute(name: str, arguments: dict[str, object]) -> str:
+            # Only returns early if the web request starts meanwhile.
+            assert web_started.wait(timeout=5)
+            return execute(name, arguments)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            web_started.set()
+            return httpx.Response(200, text="ok")
+
+        async def run() -> list[dict[str, str]]:
+            executor.firewall._async_http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await executor.execute_tool_calls_async(
+                    [
+                        _call("c1", "write_file", {"path": "a.txt", "content": "hi"}),
+                        _call("c2", "web_request", {"url": "http://93.184.216.34/"}),
+                    ]
+                )
+            finally:
+                await executor.firewall.aclose()
+
+        monkeypatch.setattr(executor, "execute_tool_call", slow_execute)
+        results = asyncio.run(run())
+        statuses = [json.loads(r["content"])["status"] for r in results]
+        assert statuses == ["success", "success"]